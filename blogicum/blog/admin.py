@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Category, Location, Post, Comment
+from .models import Category, Location, Post, Comment, QueuedTask
 
 
 class PostAdminInLine(admin.StackedInline):
@@ -41,6 +41,7 @@ class PostAdmin(admin.ModelAdmin):
     )
     list_filter = (
         'category',
+        'image_status',
     )
     search_fields = ('title',)
     empty_value_display = 'Не задано'
@@ -66,7 +67,22 @@ class CommentAdmin(admin.ModelAdmin):
     )
 
 
+class QueuedTaskAdmin(admin.ModelAdmin):
+    list_display = (
+        'name',
+        'status',
+        'attempts',
+        'run_after',
+        'created_at',
+    )
+    list_filter = (
+        'status',
+        'name',
+    )
+
+
 admin.site.register(Category, CategoryAdmin)
 admin.site.register(Post, PostAdmin)
 admin.site.register(Location, LocationAdmin)
 admin.site.register(Comment, CommentAdmin)
+admin.site.register(QueuedTask, QueuedTaskAdmin)
@@ -0,0 +1,194 @@
+from django.http import Http404, JsonResponse
+from django.views.generic import View
+
+from .cache import (
+    INDEX_FEED, category_feed, get_published_category, post_validators,
+    profile_feed,
+)
+from .config import API_PAGE_SIZE, COMMENTS_PER_PAGE
+from .encoders import PreciseJSONEncoder
+from .mixins import ConditionalGetMixin, FeedConditionalGetMixin
+from .models import Category, Comment, Post, User
+from .paginators import InvalidCursor, KeysetPaginator
+from .views import get_res_qs
+
+POST_FIELDS = (
+    'id', 'title', 'text', 'pub_date', 'comment_count', 'image',
+    'author__username', 'category__slug', 'category__title',
+    'location__name', 'location__is_published',
+)
+
+COMMENT_FIELDS = ('id', 'text', 'created_at', 'author__username')
+
+image_storage = Post._meta.get_field('image').storage
+
+
+def api_response(data, status=200):
+    return JsonResponse(
+        data,
+        status=status,
+        encoder=PreciseJSONEncoder,
+        json_dumps_params={'ensure_ascii': False, 'separators': (',', ':')},
+    )
+
+
+def serialize_post(row):
+    return {
+        'id': row['id'],
+        'title': row['title'],
+        'text': row['text'],
+        'pub_date': row['pub_date'],
+        'author': row['author__username'],
+        'category': {
+            'slug': row['category__slug'],
+            'title': row['category__title'],
+        },
+        'location': (
+            row['location__name'] if row['location__is_published'] else None
+        ),
+        'image': image_storage.url(row['image']) if row['image'] else None,
+        'comment_count': row['comment_count'],
+    }
+
+
+def serialize_comment(row):
+    return {
+        'id': row['id'],
+        'text': row['text'],
+        'created_at': row['created_at'],
+        'author': row['author__username'],
+    }
+
+
+class ApiView(View):
+    """Base of the read-only JSON API.
+
+    Subclasses return the payload from get_data(). Rows are read with
+    values(), so no model instances are built, and errors are answered
+    with JSON instead of the HTML error pages.
+    """
+
+    http_method_names = ('get', 'head', 'options')
+    replica_reads = True
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except Http404:
+            return api_response({'detail': 'Не найдено.'}, status=404)
+        except InvalidCursor as error:
+            return api_response({'detail': str(error)}, status=400)
+
+    def get(self, request, *args, **kwargs):
+        return api_response(self.get_data())
+
+    def paginate(self, queryset, per_page, ordering, serialize):
+        page = KeysetPaginator(queryset, per_page, ordering).page(
+            self.request.GET.get('cursor'),
+        )
+        return {
+            'results': [serialize(row) for row in page],
+            'next': self.get_page_url(page.next_cursor),
+            'previous': self.get_page_url(page.previous_cursor),
+        }
+
+    def get_page_url(self, cursor):
+        return f'{self.request.path}?cursor={cursor}' if cursor else None
+
+
+class PostListApiView(FeedConditionalGetMixin, ApiView):
+    page_cache_feed = INDEX_FEED
+
+    def get_queryset(self):
+        return get_res_qs(Post.objects)
+
+    def get_data(self):
+        data = self.paginate(
+            self.get_queryset().values(*POST_FIELDS),
+            API_PAGE_SIZE,
+            ('-pub_date', '-id'),
+            serialize_post,
+        )
+        if not data['results'] and 'cursor' not in self.request.GET:
+            self.check_feed_exists()
+        return data
+
+    def check_feed_exists(self):
+        pass
+
+
+class CategoryPostListApiView(PostListApiView):
+
+    def get_category(self):
+        category = get_published_category(self.kwargs['category_slug'])
+        if category is None:
+            raise Http404
+        return category
+
+    def get_page_cache_feed(self):
+        return category_feed(self.get_category().slug)
+
+    def get_queryset(self):
+        return super().get_queryset().filter(category=self.get_category())
+
+
+class ProfilePostListApiView(PostListApiView):
+
+    def get_page_cache_feed(self):
+        return profile_feed(self.kwargs['username'])
+
+    def get_queryset(self):
+        return super().get_queryset().filter(
+            author__username=self.kwargs['username'],
+        )
+
+    def check_feed_exists(self):
+        # Only an empty first page needs to look the author up.
+        if not User.objects.filter(username=self.kwargs['username']).exists():
+            raise Http404
+
+
+class CategoryListApiView(ApiView):
+
+    def get_data(self):
+        return {
+            'results': list(
+                Category.objects.filter(is_published=True).order_by(
+                    'title',
+                ).values('slug', 'title', 'description')
+            ),
+        }
+
+
+class PostApiMixin(ConditionalGetMixin):
+
+    def get_post(self):
+        if getattr(self, 'post', None) is None:
+            self.post = get_res_qs(Post.objects).filter(
+                pk=self.kwargs['id'],
+            ).values(*POST_FIELDS, 'updated_at').first()
+            if self.post is None:
+                raise Http404
+        return self.post
+
+    def get_validators(self):
+        return post_validators(self.get_post()['updated_at'])
+
+
+class PostApiView(PostApiMixin, ApiView):
+
+    def get_data(self):
+        return serialize_post(self.get_post())
+
+
+class CommentListApiView(PostApiMixin, ApiView):
+
+    def get_data(self):
+        return self.paginate(
+            Comment.objects.filter(
+                post_id=self.get_post()['id'],
+            ).values(*COMMENT_FIELDS),
+            COMMENTS_PER_PAGE,
+            ('created_at', 'id'),
+            serialize_comment,
+        )
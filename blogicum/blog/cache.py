@@ -0,0 +1,184 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from .config import (
+    CATEGORY_MAP_TIMEOUT, FEED_COUNT_CACHE_TIMEOUT, FEED_PAGE_CACHE_TIMEOUT,
+)
+from .models import Category, Post
+
+POST_CARD = 'post_card'
+INDEX_FEED = 'feed:index'
+PUBLICATION_BOUNDARY_KEY = 'blog:publication_boundary'
+NO_BOUNDARY = datetime(9999, 1, 1, tzinfo=timezone.utc)
+
+
+def feed_count_key(category_id=None):
+    return f'blog:feed_count:{category_id or "all"}'
+
+
+def invalidate_feed_counts(*category_ids):
+    cache.delete_many([
+        feed_count_key(),
+        *(feed_count_key(pk) for pk in set(category_ids) if pk),
+    ])
+
+
+def version_key(name):
+    return f'blog:version:{name}'
+
+
+def get_version(name):
+    return cache.get_or_set(version_key(name), time.time_ns, None)
+
+
+def bump_versions(*names):
+    version = time.time_ns()
+    cache.set_many({version_key(name): version for name in names}, None)
+
+
+def category_feed(slug):
+    return f'feed:category:{slug}'
+
+
+def profile_feed(username):
+    return f'feed:profile:{username}'
+
+
+def bump_feeds(category_slugs=(), usernames=()):
+    bump_versions(
+        INDEX_FEED,
+        *(category_feed(slug) for slug in set(category_slugs) if slug),
+        *(profile_feed(name) for name in set(usernames) if name),
+    )
+
+
+def feed_rows(**filters):
+    return set(
+        Post.objects.filter(**filters).values_list(
+            'category_id', 'category__slug', 'author__username',
+        ).distinct()
+    )
+
+
+def invalidate_feeds(rows, category_slugs=(), usernames=(), counts=True):
+    if counts:
+        invalidate_feed_counts(*(category_id for category_id, _, _ in rows))
+    bump_feeds(
+        category_slugs={slug for _, slug, _ in rows} | set(category_slugs),
+        usernames={name for _, _, name in rows} | set(usernames),
+    )
+
+
+def get_publication_boundary():
+    """Return the pub_date before which published posts are visible.
+
+    The boundary is the earliest pub_date still in the future, so feeds
+    filter on a value that stays the same until that post is due instead
+    of on the current time. The first call after it passes moves it on and
+    bumps the feeds of the posts that went live.
+    """
+    boundary = cache.get(PUBLICATION_BOUNDARY_KEY)
+    if boundary is None or boundary <= timezone.now():
+        boundary = publish_due_posts(boundary)
+    return boundary
+
+
+def publish_due_posts(previous=None):
+    now = timezone.now()
+    boundary = Post.objects.filter(
+        is_published=True, pub_date__gt=now,
+    ).aggregate(boundary=Min('pub_date'))['boundary'] or NO_BOUNDARY
+    cache.set(PUBLICATION_BOUNDARY_KEY, boundary, None)
+    if previous is None:
+        # The key was evicted: cached pages and counts may hide posts that
+        # went live while they were stored.
+        previous = now - timedelta(seconds=max(
+            FEED_PAGE_CACHE_TIMEOUT, FEED_COUNT_CACHE_TIMEOUT,
+        ))
+    invalidate_feeds(feed_rows(
+        is_published=True, pub_date__gte=previous, pub_date__lte=now,
+    ))
+    return boundary
+
+
+def reset_publication_boundary():
+    """Recompute the boundary after writes that bypass the Post signals.
+
+    Code writing pub_date with QuerySet.update() or bulk inserts must
+    call it, or the cached boundary can let a scheduled post show early.
+    """
+    publish_due_posts(cache.get(PUBLICATION_BOUNDARY_KEY))
+
+
+def lower_publication_boundary(pub_date):
+    def lower():
+        boundary = cache.get(PUBLICATION_BOUNDARY_KEY)
+        if boundary is not None and timezone.now() < pub_date < boundary:
+            cache.set(PUBLICATION_BOUNDARY_KEY, pub_date, None)
+
+    transaction.on_commit(lower)
+
+
+def feed_validators(feed):
+    """Return the ETag and Last-Modified timestamp of a post feed.
+
+    The feed version changes, and records when, on every edit that can
+    alter the feed and when scheduled posts of the feed go live.
+    """
+    get_publication_boundary()
+    version = get_version(feed)
+    return str(version), version // 10 ** 9
+
+
+def post_validators(updated_at):
+    """Return the ETag and Last-Modified timestamp of a post page.
+
+    Post.updated_at moves with comments too; the post card version covers
+    renamed authors, categories and locations.
+    """
+    version = get_version(POST_CARD)
+    updated_at = updated_at.timestamp()
+    return (
+        f'{version}-{updated_at}',
+        max(version // 10 ** 9, int(updated_at)),
+    )
+
+
+def feed_page_key(feed, *parts):
+    get_publication_boundary()
+    return ':'.join(
+        ('blog:page', feed, str(get_version(feed)), *map(str, parts))
+    )
+
+
+_categories = {}
+_categories_lock = threading.Lock()
+
+
+def get_published_category(slug):
+    """Return a published category by slug from the in-process map.
+
+    The map is cleared by Category signals in this process; entries also
+    expire after CATEGORY_MAP_TIMEOUT to bound staleness in other workers.
+    """
+    entry = _categories.get(slug)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    category = Category.objects.filter(slug=slug, is_published=True).first()
+    if category is not None:
+        with _categories_lock:
+            _categories[slug] = (
+                category, time.monotonic() + CATEGORY_MAP_TIMEOUT,
+            )
+    return category
+
+
+def clear_category_map():
+    with _categories_lock:
+        _categories.clear()
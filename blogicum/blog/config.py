@@ -1 +1,59 @@
 POST_PER_PAGES = 10
+
+KEYSET_PAGINATION = False
+
+FEED_COUNT_CACHE_TIMEOUT = 60 * 5
+
+POST_CARD_CACHE_TIMEOUT = 60 * 60 * 24
+
+FEED_PAGE_CACHE_TIMEOUT = 60 * 5
+
+CATEGORY_MAP_TIMEOUT = 60
+
+PRIMARY_PIN_COOKIE = 'pin_primary'
+
+PRIMARY_PIN_SECONDS = 10
+
+COMMENTS_PER_PAGE = 20
+
+POST_IMAGE_RENDITIONS = {
+    'feed': 640,
+    'detail': 1280,
+}
+
+POST_IMAGE_QUALITY = 80
+
+TASK_MAX_RETRIES = 3
+
+TASK_RETRY_DELAY = 5
+
+TASK_POLL_INTERVAL = 1
+
+# A running task not finished within this time is claimed again.
+TASK_LEASE_TIMEOUT = 60 * 10
+
+EXPORT_CHUNK_SIZE = 2000
+
+IMPORT_BATCH_SIZE = 5000
+
+# bm25 weights of Post.title and Post.text in search results.
+SEARCH_WEIGHTS = (10.0, 1.0)
+
+SEARCH_MAX_TERMS = 8
+
+SEARCH_MAX_CANDIDATES = 1000
+
+# Matches checked against the visibility filters per query.
+SEARCH_CHUNK_SIZE = 500
+
+SUGGEST_LIMIT = 5
+
+SUGGEST_INDEX_TIMEOUT = 60 * 10
+
+SYNDICATION_ITEMS = 20
+
+API_PAGE_SIZE = 20
+
+PUBLISH_POLL_INTERVAL = 1
+
+TIMING_SAMPLES = 1000
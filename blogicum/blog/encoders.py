@@ -0,0 +1,12 @@
+import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class PreciseJSONEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder keeping the microseconds of datetimes."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
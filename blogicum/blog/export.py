@@ -0,0 +1,98 @@
+import csv
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+
+from .config import EXPORT_CHUNK_SIZE
+from .encoders import PreciseJSONEncoder
+from .models import Category, Comment, Location, Post
+
+# model, exported columns, date column, category lookup
+EXPORTS = {
+    'posts': (
+        Post,
+        (
+            'id', 'title', 'text', 'pub_date', 'is_published', 'created_at',
+            'updated_at', 'author__username', 'category__slug',
+            'location_id', 'image', 'comment_count',
+        ),
+        'pub_date',
+        'category__slug',
+    ),
+    'comments': (
+        Comment,
+        (
+            'id', 'post_id', 'author__username', 'text', 'is_published',
+            'created_at',
+        ),
+        'created_at',
+        'post__category__slug',
+    ),
+    'categories': (
+        Category,
+        ('id', 'title', 'description', 'slug', 'is_published', 'created_at'),
+        'created_at',
+        'slug',
+    ),
+    'locations': (
+        Location,
+        ('id', 'name', 'is_published', 'created_at'),
+        'created_at',
+        'post__category__slug',
+    ),
+}
+
+FORMATS = {
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def export_queryset(name, since=None, until=None, category=None):
+    model, columns, date_field, category_lookup = EXPORTS[name]
+    queryset = model.objects.order_by('pk')
+    if since:
+        queryset = queryset.filter(**{
+            f'{date_field}__gte': timezone.make_aware(
+                datetime.combine(since, time.min),
+            ),
+        })
+    if until:
+        queryset = queryset.filter(**{
+            f'{date_field}__lt': timezone.make_aware(
+                datetime.combine(until + timedelta(days=1), time.min),
+            ),
+        })
+    if category:
+        queryset = queryset.filter(**{category_lookup: category})
+        if category_lookup.count('__') > 1:
+            queryset = queryset.distinct()
+    return queryset.values_list(*columns)
+
+
+class Echo:
+
+    def write(self, value):
+        return value
+
+
+def export_lines(name, queryset, export_format,
+                 chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the queryset as NDJSON or CSV lines, one row at a time.
+
+    Rows are fetched with ``iterator()``, so memory use does not grow with
+    the number of exported rows.
+    """
+    columns = [column.replace('__', '_') for column in EXPORTS[name][1]]
+    rows = queryset.iterator(chunk_size=chunk_size)
+    if export_format == 'csv':
+        writer = csv.writer(Echo())
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow(row)
+        return
+    encoder = PreciseJSONEncoder(
+        ensure_ascii=False, separators=(',', ':'),
+    )
+    for row in rows:
+        yield encoder.encode(dict(zip(columns, row))) + '\n'
@@ -0,0 +1,140 @@
+from django.contrib.syndication.views import Feed
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import http_date, quote_etag
+
+from .cache import (
+    INDEX_FEED, category_feed, feed_validators, get_published_category,
+    profile_feed,
+)
+from .config import SYNDICATION_ITEMS
+from .models import Post, User
+from .views import get_res_qs
+
+
+class PostFeed(Feed):
+    """RSS feed of the posts shown on the index page.
+
+    ETag and Last-Modified are computed before the feed is built, so a
+    poll that matches them gets a 304 without loading any post.
+    """
+
+    replica_reads = True
+
+    def __call__(self, request, *args, **kwargs):
+        obj = self.get_object(request, *args, **kwargs)
+        etag, last_modified = feed_validators(self.get_feed_name(obj))
+        etag = quote_etag(f'{self.feed_type.__name__}-{etag}')
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified,
+        )
+        if response is None:
+            feedgen = self.get_feed(obj, request)
+            response = HttpResponse(content_type=feedgen.content_type)
+            feedgen.write(response, 'utf-8')
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def get_feed_name(self, obj):
+        return INDEX_FEED
+
+    def get_queryset(self, obj):
+        return get_res_qs(Post.objects)
+
+    def title(self, obj):
+        return 'Блогикум'
+
+    def description(self, obj):
+        return 'Новые публикации Блогикума'
+
+    def link(self, obj):
+        return reverse('blog:index')
+
+    def items(self, obj):
+        return self.get_queryset(obj)[:SYNDICATION_ITEMS]
+
+    def item_title(self, post):
+        return post.title
+
+    def item_description(self, post):
+        return post.text
+
+    def item_pubdate(self, post):
+        return post.pub_date
+
+    def item_updateddate(self, post):
+        return post.updated_at
+
+    def item_author_name(self, post):
+        return post.author.get_full_name() or post.author.username
+
+    def item_categories(self, post):
+        return (post.category.title,)
+
+
+class CategoryPostFeed(PostFeed):
+
+    def get_object(self, request, category_slug):
+        category = get_published_category(category_slug)
+        if category is None:
+            raise Http404
+        return category
+
+    def get_feed_name(self, category):
+        return category_feed(category.slug)
+
+    def get_queryset(self, category):
+        return super().get_queryset(category).filter(category=category)
+
+    def title(self, category):
+        return f'Блогикум: {category.title}'
+
+    def description(self, category):
+        return category.description
+
+    def link(self, category):
+        return reverse('blog:category_posts', args=(category.slug,))
+
+
+class ProfilePostFeed(PostFeed):
+
+    def get_object(self, request, username):
+        return get_object_or_404(User, username=username)
+
+    def get_feed_name(self, author):
+        return profile_feed(author.username)
+
+    def get_queryset(self, author):
+        return super().get_queryset(author).filter(author=author)
+
+    def title(self, author):
+        return f'Блогикум: {author.get_full_name() or author.username}'
+
+    def description(self, author):
+        return f'Публикации пользователя {author.username}'
+
+    def link(self, author):
+        return reverse('blog:profile', args=(author.username,))
+
+
+class AtomFeedMixin:
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
+
+
+class AtomPostFeed(AtomFeedMixin, PostFeed):
+    pass
+
+
+class AtomCategoryPostFeed(AtomFeedMixin, CategoryPostFeed):
+    pass
+
+
+class AtomProfilePostFeed(AtomFeedMixin, ProfilePostFeed):
+    pass
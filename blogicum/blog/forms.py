@@ -1,5 +1,6 @@
 from django import forms
 
+from .export import FORMATS
 from .models import Comment, Post, User
 
 
@@ -29,3 +30,13 @@ class CommentForm(forms.ModelForm):
     class Meta:
         model = Comment
         fields = ('text',)
+
+
+class ExportForm(forms.Form):
+    format = forms.ChoiceField(
+        choices=[(name, name) for name in FORMATS],
+        required=False,
+    )
+    since = forms.DateField(required=False)
+    until = forms.DateField(required=False)
+    category = forms.SlugField(required=False)
@@ -0,0 +1,109 @@
+import hashlib
+import posixpath
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .config import POST_IMAGE_QUALITY, POST_IMAGE_RENDITIONS
+from .models import ImageStatus, Post
+from .tasks import task
+
+RENDITIONS_DIR = 'posts_images/renditions'
+FORMATS = (
+    ('webp', 'WEBP'),
+    ('jpg', 'JPEG'),
+)
+
+
+def content_hash(file):
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in file.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def encode(image, image_format):
+    buffer = BytesIO()
+    if image_format == 'JPEG' and image.mode != 'RGB':
+        image = image.convert('RGB')
+    image.save(
+        buffer, image_format, quality=POST_IMAGE_QUALITY, optimize=True,
+    )
+    return buffer.getvalue()
+
+
+def build_renditions(image_field):
+    """Render every size of POST_IMAGE_RENDITIONS in WebP and JPEG.
+
+    File names carry a hash of the original, so the same upload is never
+    rendered twice and the URLs can be cached by browsers forever.
+    """
+    storage = image_field.storage
+    with image_field.open('rb') as file:
+        digest = content_hash(file)
+        file.seek(0)
+        with Image.open(file) as original:
+            original = ImageOps.exif_transpose(original)
+            if original.mode not in ('RGB', 'RGBA'):
+                original = original.convert('RGBA')
+            renditions = {'source': image_field.name}
+            for name, max_width in POST_IMAGE_RENDITIONS.items():
+                image = original.copy()
+                image.thumbnail(
+                    (max_width, max_width * 4), Image.Resampling.LANCZOS,
+                )
+                rendition = {'width': image.width, 'height': image.height}
+                for extension, image_format in FORMATS:
+                    path = posixpath.join(
+                        RENDITIONS_DIR,
+                        f'{digest}-{image.width}w.{extension}',
+                    )
+                    if not storage.exists(path):
+                        path = storage.save(
+                            path, ContentFile(encode(image, image_format)),
+                        )
+                    rendition[extension] = path
+                renditions[name] = rendition
+    return renditions
+
+
+def renditions_are_stale(post):
+    return post.image.name != post.renditions.get('source', '')
+
+
+def update_renditions(post):
+    try:
+        post.renditions = build_renditions(post.image)
+        post.image_status = ImageStatus.READY
+    except (UnidentifiedImageError, Image.DecompressionBombError):
+        post.renditions = {'source': post.image.name}
+        post.image_status = ImageStatus.FAILED
+    post.save(update_fields=('renditions', 'image_status', 'updated_at'))
+
+
+def mark_renditions_failed(args, error):
+    post_id, image_name = args
+    Post.objects.filter(pk=post_id, image=image_name).update(
+        image_status=ImageStatus.FAILED,
+    )
+
+
+@task(on_failure=mark_renditions_failed)
+def render_post_image(post_id, image_name):
+    post = Post.objects.filter(pk=post_id, image=image_name).first()
+    if post is not None and renditions_are_stale(post):
+        update_renditions(post)
+
+
+def schedule_renditions(post):
+    if not post.image:
+        post.renditions, post.image_status = {}, ImageStatus.NONE
+    else:
+        post.image_status = ImageStatus.PENDING
+    Post.objects.filter(pk=post.pk).update(
+        renditions=post.renditions, image_status=post.image_status,
+    )
+    if post.image:
+        render_post_image.delay(post.pk, post.image.name)
@@ -0,0 +1,343 @@
+import csv
+import json
+from datetime import datetime
+from functools import partial
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .cache import (
+    POST_CARD, bump_feeds, bump_versions, clear_category_map,
+    invalidate_feed_counts, reset_publication_boundary,
+)
+from .models import Category, Comment, Location, Post, User
+
+IN_QUERY_SIZE = 500
+
+INTEGER_TYPES = (
+    'AutoField', 'BigAutoField', 'IntegerField', 'BigIntegerField',
+    'PositiveIntegerField', 'SmallIntegerField',
+)
+
+
+def read_rows(file, import_format):
+    if import_format == 'csv':
+        yield from csv.DictReader(file)
+        return
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def batches(rows, size):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def existing_ids(model, ids):
+    ids = sorted({int(pk) for pk in ids})
+    found = set()
+    table = connection.ops.quote_name(model._meta.db_table)
+    column = connection.ops.quote_name(model._meta.pk.column)
+    with connection.cursor() as cursor:
+        for start in range(0, len(ids), IN_QUERY_SIZE):
+            chunk = ids[start:start + IN_QUERY_SIZE]
+            cursor.execute(
+                f'SELECT {column} FROM {table} WHERE {column} IN '
+                f'({", ".join(["%s"] * len(chunk))})',
+                chunk,
+            )
+            found.update(pk for pk, in cursor.fetchall())
+    return found
+
+
+def parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    return value.strip().lower() in ('1', 't', 'true', 'yes')
+
+
+def parse_datetime(value, adapt):
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = timezone.make_aware(value)
+    return adapt(value)
+
+
+def get_datetime_adapter():
+    if connection.vendor != 'sqlite':
+        return connection.ops.adapt_datetimefield_value
+    # The text adapt_datetimefield_value() stores, without its per-call
+    # settings lookups, which cost more than parsing the value.
+    db_timezone = connection.timezone
+    return lambda value: str(
+        value.astimezone(db_timezone).replace(tzinfo=None)
+    )
+
+
+def get_default_getter(field):
+    if field.has_default() and callable(field.default):
+        return lambda: field.get_db_prep_save(field.get_default(), connection)
+    value = field.get_db_prep_save(field.get_default(), connection)
+    return lambda: value
+
+
+def get_converter(field):
+    internal_type = field.get_internal_type()
+    if internal_type == 'DateTimeField':
+        return partial(parse_datetime, adapt=get_datetime_adapter())
+    if internal_type == 'BooleanField':
+        return parse_bool
+    if internal_type in INTEGER_TYPES:
+        return int
+    return str
+
+
+class Importer:
+    """Write rows produced by export_blog back, one transaction per batch.
+
+    bulk_create prepares every value of every instance through the field
+    API, which caps it at a few thousand rows per second; here each
+    column gets one plain converter and the batch goes to executemany().
+    Related objects are resolved through dictionaries loaded once, so a
+    row costs no queries of its own. Rows must keep their ``id``; with
+    ``resume`` the ids already in the database are skipped, which makes
+    an interrupted import safe to run again.
+    """
+
+    model = None
+    columns = ()
+
+    def __init__(self, resume=False):
+        self.resume = resume
+        self.skipped = 0
+        self.fields = self.model._meta.concrete_fields
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+        self.plan = [
+            (
+                field.attname,
+                get_converter(field) if field.name in self.columns
+                else None,
+                (lambda: now) if getattr(field, 'auto_now', False)
+                or getattr(field, 'auto_now_add', False)
+                else get_default_getter(field),
+            )
+            for field in self.fields
+        ]
+        quote = connection.ops.quote_name
+        self.sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            quote(self.model._meta.db_table),
+            ', '.join(quote(field.column) for field in self.fields),
+            ', '.join(['%s'] * len(self.fields)),
+        )
+
+    def import_batch(self, rows):
+        if self.resume:
+            done = existing_ids(
+                self.model, (row['id'] for row in rows if row.get('id')),
+            )
+            kept = [row for row in rows if self.parse_id(row) not in done]
+            self.skipped += len(rows) - len(kept)
+            rows = kept
+        values = [
+            value for value in (self.build(row) for row in rows)
+            if value is not None
+        ]
+        # Related ids are checked above, so as loaddata does, let SQLite
+        # skip the per-row foreign key lookups and verify them in finish().
+        with connection.constraint_checks_disabled():
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(self.sql, values)
+        return len(values)
+
+    def parse_id(self, row):
+        return int(row['id']) if row.get('id') else None
+
+    def get_related(self, row):
+        return {}
+
+    def build(self, row):
+        related = self.get_related(row)
+        if related is None:
+            return None
+        values = []
+        for name, convert, default in self.plan:
+            if name in related:
+                values.append(related[name])
+                continue
+            value = row.get(name) if convert else None
+            values.append(
+                default() if value is None or value == ''
+                else convert(value)
+            )
+        return values
+
+    def finish(self):
+        connection.check_constraints(table_names=[self.model._meta.db_table])
+        if connection.vendor != 'sqlite':
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sequence_reset_sql(
+                    no_style(), [self.model],
+                ):
+                    cursor.execute(sql)
+
+
+class UserMapMixin:
+
+    def load_users(self):
+        self.users = dict(User.objects.values_list('username', 'id'))
+
+    def resolve_users(self, rows):
+        missing = {
+            row['author_username'] for row in rows
+            if row.get('author_username')
+            and row['author_username'] not in self.users
+        }
+        if missing:
+            User.objects.bulk_create(
+                User(username=name, password=make_password(None))
+                for name in missing
+            )
+            self.users.update(User.objects.filter(
+                username__in=missing,
+            ).values_list('username', 'id'))
+
+
+class CategoryImporter(Importer):
+    model = Category
+    columns = (
+        'id', 'title', 'description', 'slug', 'is_published', 'created_at',
+    )
+
+    def finish(self):
+        super().finish()
+        clear_category_map()
+        invalidate_feed_counts(*Category.objects.values_list('pk', flat=True))
+        bump_feeds(Category.objects.values_list('slug', flat=True))
+
+
+class LocationImporter(Importer):
+    model = Location
+    columns = ('id', 'name', 'is_published', 'created_at')
+
+    def finish(self):
+        super().finish()
+        bump_versions(POST_CARD)
+
+
+class PostImporter(UserMapMixin, Importer):
+    model = Post
+    columns = (
+        'id', 'title', 'text', 'pub_date', 'is_published', 'created_at',
+        'updated_at', 'image',
+    )
+
+    def __init__(self, resume=False):
+        super().__init__(resume)
+        self.load_users()
+        self.categories = dict(Category.objects.values_list('slug', 'id'))
+        self.category_ids = set()
+        self.usernames = set()
+
+    def import_batch(self, rows):
+        self.resolve_users(rows)
+        # Location names are not unique, so posts refer to them by id;
+        # an id missing from the database leaves the post without one.
+        self.known_locations = existing_ids(
+            Location, (row['location_id'] for row in rows
+                       if row.get('location_id')),
+        )
+        return super().import_batch(rows)
+
+    def get_location_id(self, row):
+        if not row.get('location_id'):
+            return None
+        location_id = int(row['location_id'])
+        return location_id if location_id in self.known_locations else None
+
+    def get_related(self, row):
+        category_id = self.categories.get(row.get('category_slug'))
+        self.category_ids.add(category_id)
+        self.usernames.add(row['author_username'])
+        return {
+            'author_id': self.users[row['author_username']],
+            'category_id': category_id,
+            'location_id': self.get_location_id(row),
+        }
+
+    def finish(self):
+        super().finish()
+        reset_publication_boundary()
+        invalidate_feed_counts(*self.category_ids)
+        bump_feeds(
+            Category.objects.filter(
+                pk__in=self.category_ids,
+            ).values_list('slug', flat=True),
+            self.usernames,
+        )
+
+
+class CommentImporter(UserMapMixin, Importer):
+    model = Comment
+    columns = ('id', 'text', 'is_published', 'created_at')
+
+    def __init__(self, resume=False):
+        super().__init__(resume)
+        self.load_users()
+        self.post_ids = set()
+        self.orphans = 0
+
+    def import_batch(self, rows):
+        self.resolve_users(rows)
+        post_ids = {int(row['post_id']) for row in rows}
+        self.known_posts = existing_ids(Post, post_ids)
+        self.post_ids |= self.known_posts
+        return super().import_batch(rows)
+
+    def get_related(self, row):
+        post_id = int(row['post_id'])
+        if post_id not in self.known_posts:
+            self.orphans += 1
+            return None
+        return {
+            'post_id': post_id,
+            'author_id': self.users[row['author_username']],
+        }
+
+    def finish(self):
+        super().finish()
+        # Bulk inserts bypass the Comment signals keeping comment_count, so
+        # recount the touched range from the table; rows skipped by
+        # --resume are included, which repairs an interrupted run too.
+        if not self.post_ids:
+            return
+        counts = Comment.objects.filter(
+            post=OuterRef('pk'),
+        ).order_by().values('post').annotate(
+            total=Count('pk'),
+        ).values('total')
+        Post.objects.filter(
+            pk__gte=min(self.post_ids), pk__lte=max(self.post_ids),
+        ).annotate(
+            actual=Coalesce(Subquery(counts), 0),
+        ).exclude(comment_count=F('actual')).update(
+            comment_count=F('actual'),
+            updated_at=timezone.now(),
+        )
+        bump_feeds()
+        bump_versions(POST_CARD)
+
+
+IMPORTERS = {
+    'categories': CategoryImporter,
+    'locations': LocationImporter,
+    'posts': PostImporter,
+    'comments': CommentImporter,
+}
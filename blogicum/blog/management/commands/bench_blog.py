@@ -0,0 +1,173 @@
+import json
+import statistics
+import subprocess
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from blog.forms import PostForm
+from blog.models import Category, Comment, Post
+from blog.timing import percentile
+from blog.views import get_res_qs
+
+
+class Command(BaseCommand):
+    help = (
+        'Измеряет задержку и число SQL-запросов основных страниц блога на '
+        'текущей базе (заполните её командой seed_blog) и выводит JSON. '
+        'Запросы на запись фиксируются, а после замера отменяются. '
+        'С --baseline сравнивает результат с прошлым запуском и '
+        'завершается с ошибкой при регрессии.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50)
+        parser.add_argument('--warmup', type=int, default=3)
+        parser.add_argument(
+            '--anonymous', action='store_true',
+            help='Читать страницы без входа, через кэш страниц.',
+        )
+        parser.add_argument('--output', help='Файл для JSON вместо stdout.')
+        parser.add_argument('--baseline', help='JSON прошлого запуска.')
+        parser.add_argument(
+            '--tolerance', type=float, default=0.5,
+            help='Допустимый рост p50 задержки относительно --baseline.',
+        )
+
+    def handle(self, *args, **options):
+        post = get_res_qs(Post.objects).order_by('-comment_count').first()
+        if post is None:
+            raise CommandError('Нет публикаций: сначала запустите seed_blog.')
+        category = Category.objects.filter(
+            is_published=True,
+        ).order_by('pk').first()
+        author_client = Client()
+        author_client.force_login(post.author)
+        reader = Client() if options['anonymous'] else author_client
+        form = PostForm(instance=post)
+        post_data = {
+            name: '' if form[name].value() is None else form[name].value()
+            for name in form.fields if name != 'image'
+        }
+        last_comment = Comment.objects.order_by('-pk').values_list(
+            'pk', flat=True,
+        ).first() or 0
+
+        def delete_comments():
+            Comment.objects.filter(
+                post=post, author=post.author, pk__gt=last_comment,
+            ).delete()
+
+        scenarios = (
+            ('index', reader, 'get', reverse('blog:index'), None, None),
+            (
+                'category_posts', reader, 'get',
+                reverse('blog:category_posts', args=(category.slug,)), None,
+                None,
+            ),
+            (
+                'profile', reader, 'get',
+                reverse('blog:profile', args=(post.author.username,)), None,
+                None,
+            ),
+            (
+                'post_detail', reader, 'get',
+                reverse('blog:post_detail', args=(post.pk,)), None, None,
+            ),
+            (
+                'add_comment', author_client, 'post',
+                reverse('blog:add_comment', args=(post.pk,)),
+                {'text': 'Комментарий из бенчмарка'}, delete_comments,
+            ),
+            (
+                'edit_post', author_client, 'post',
+                reverse('blog:edit_post', args=(post.pk,)), post_data,
+                post.save,
+            ),
+        )
+        hosts = [*settings.ALLOWED_HOSTS, 'testserver']
+        with override_settings(DEBUG=False, ALLOWED_HOSTS=hosts):
+            views = {
+                name: self.measure(client, method, url, data, undo, options)
+                for name, client, method, url, data, undo in scenarios
+            }
+        result = {
+            'commit': self.get_commit(),
+            'posts': Post.objects.count(),
+            'requests': options['requests'],
+            'anonymous': options['anonymous'],
+            'views': views,
+        }
+        output = json.dumps(result, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                file.write(output + '\n')
+        else:
+            self.stdout.write(output)
+        if options['baseline']:
+            self.compare(result, options['baseline'], options['tolerance'])
+
+    def measure(self, client, method, url, data, undo, options):
+        # Writes are committed, not rolled back, so that their on_commit
+        # cache invalidation and task scheduling are measured too and the
+        # reads that follow see the caches a real edit leaves; undo()
+        # restores the data outside of the measured request.
+        latencies, queries, db_times = [], [], []
+        for number in range(options['warmup'] + options['requests']):
+            response = getattr(client, method)(url, data)
+            if undo is not None:
+                undo()
+            if number < options['warmup']:
+                continue
+            timing = response.wsgi_request.timing
+            latencies.append(timing.total * 1000)
+            queries.append(timing.queries)
+            db_times.append(timing.db_time * 1000)
+        latencies.sort()
+        return {
+            'url': url,
+            'status': response.status_code,
+            'queries': max(queries),
+            'latency_ms': {
+                'p50': round(percentile(latencies, 50), 2),
+                'p95': round(percentile(latencies, 95), 2),
+                'p99': round(percentile(latencies, 99), 2),
+                'mean': round(statistics.mean(latencies), 2),
+            },
+            'db_ms': round(statistics.median(db_times), 2),
+        }
+
+    def get_commit(self):
+        try:
+            return subprocess.run(
+                ('git', 'rev-parse', '--short', 'HEAD'),
+                cwd=settings.BASE_DIR, capture_output=True, text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def compare(self, result, path, tolerance):
+        with open(path, encoding='utf-8') as file:
+            baseline = json.load(file)['views']
+        regressions = []
+        for name, current in result['views'].items():
+            previous = baseline.get(name)
+            if previous is None:
+                continue
+            before = previous['latency_ms']['p50']
+            after = current['latency_ms']['p50']
+            self.stderr.write(
+                f'{name}: p50 {before} → {after} мс, запросов '
+                f'{previous["queries"]} → {current["queries"]}'
+            )
+            if (
+                after > before * (1 + tolerance)
+                or current['queries'] > previous['queries']
+            ):
+                regressions.append(name)
+        if regressions:
+            raise CommandError(f'Регрессии: {", ".join(regressions)}')
@@ -0,0 +1,142 @@
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections, transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from blog.models import Category, Post, User
+from blog.views import get_res_qs
+
+BENCH_ALIAS = 'bench_sqlite'
+
+
+class Command(BaseCommand):
+    help = (
+        'Сравнивает пропускную способность SQLite со стандартными и '
+        'настроенными PRAGMA на смешанной нагрузке чтения ленты и записи '
+        'комментариев. Работает с временной базой данных.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=float, default=5)
+        parser.add_argument('--readers', type=int, default=4)
+        parser.add_argument('--writers', type=int, default=4)
+
+    def handle(self, *args, **options):
+        variants = (
+            ('stock', {}),
+            ('tuned', settings.SQLITE_PRAGMAS),
+        )
+        for label, pragmas in variants:
+            with tempfile.TemporaryDirectory() as directory:
+                result = self.run_variant(
+                    Path(directory) / 'bench.sqlite3', pragmas, options,
+                )
+            self.stdout.write(
+                f'{label:>6}: {result["writes"] / options["seconds"]:8.1f} '
+                f'writes/s  {result["reads"] / options["seconds"]:8.1f} '
+                f'reads/s  {result["locked"]} locked errors'
+            )
+
+    def run_variant(self, path, pragmas, options):
+        connections.databases[BENCH_ALIAS] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': str(path),
+        }
+        try:
+            with override_settings(SQLITE_PRAGMAS=pragmas):
+                post_ids, author_id = self.prepare()
+                return self.run_workload(post_ids, author_id, options)
+        finally:
+            connections[BENCH_ALIAS].close()
+            del connections.databases[BENCH_ALIAS]
+            delattr(connections._connections, BENCH_ALIAS)
+
+    def prepare(self):
+        call_command('migrate', database=BENCH_ALIAS, verbosity=0)
+        author = User.objects.db_manager(BENCH_ALIAS).create(
+            username='bench',
+        )
+        category = Category.objects.using(BENCH_ALIAS).create(
+            title='bench', description='', slug='bench',
+        )
+        Post.objects.using(BENCH_ALIAS).bulk_create(
+            Post(
+                title=f'Пост {number}',
+                text='Текст',
+                pub_date=timezone.now(),
+                author=author,
+                category=category,
+            )
+            for number in range(100)
+        )
+        post_ids = Post.objects.using(BENCH_ALIAS).values_list(
+            'pk', flat=True,
+        )
+        return list(post_ids), author.pk
+
+    def run_workload(self, post_ids, author_id, options):
+        self.counters = {'reads': 0, 'writes': 0, 'locked': 0}
+        self.counters_lock = threading.Lock()
+        deadline = time.monotonic() + options['seconds']
+        threads = [
+            threading.Thread(target=self.read, args=(deadline,))
+            for _ in range(options['readers'])
+        ] + [
+            threading.Thread(
+                target=self.write,
+                args=(deadline, post_ids[number % len(post_ids)], author_id),
+            )
+            for number in range(options['writers'])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self.counters
+
+    def count(self, name):
+        with self.counters_lock:
+            self.counters[name] += 1
+
+    def read(self, deadline):
+        try:
+            while time.monotonic() < deadline:
+                list(get_res_qs(Post.objects.using(BENCH_ALIAS))[:10])
+                self.count('reads')
+        finally:
+            connections[BENCH_ALIAS].close()
+
+    def write(self, deadline, post_id, author_id):
+        try:
+            while time.monotonic() < deadline:
+                try:
+                    self.add_comment(post_id, author_id)
+                except OperationalError:
+                    self.count('locked')
+                else:
+                    self.count('writes')
+        finally:
+            connections[BENCH_ALIAS].close()
+
+    def add_comment(self, post_id, author_id):
+        now = timezone.now()
+        with transaction.atomic(using=BENCH_ALIAS):
+            with connections[BENCH_ALIAS].cursor() as cursor:
+                cursor.execute(
+                    'INSERT INTO blog_comment '
+                    '(text, post_id, author_id, created_at, is_published) '
+                    'VALUES (%s, %s, %s, %s, %s)',
+                    ['Комментарий', post_id, author_id, now, True],
+                )
+                cursor.execute(
+                    'UPDATE blog_post SET comment_count = comment_count + 1, '
+                    'updated_at = %s WHERE id = %s',
+                    [now, post_id],
+                )
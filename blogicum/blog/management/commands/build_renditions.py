@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from blog.images import renditions_are_stale, update_renditions
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = (
+        'Создаёт уменьшенные копии фото для публикаций, у которых их нет '
+        'или которые устарели.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Пересоздать копии для всех публикаций с фото.',
+        )
+
+    def handle(self, *args, **options):
+        posts = Post.objects.exclude(image='')
+        built = 0
+        for post in posts.iterator():
+            if options['force'] or renditions_are_stale(post):
+                update_renditions(post)
+                built += 1
+        self.stdout.write(
+            self.style.SUCCESS(f'Обработано публикаций: {built}')
+        )
@@ -0,0 +1,64 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog.config import POST_PER_PAGES
+from blog.models import Comment, Post
+from blog.paginators import KeysetPaginator
+from blog.views import get_res_qs
+
+
+class Command(BaseCommand):
+    help = (
+        'Выводит план выполнения и время запросов лент публикаций на '
+        'текущей базе (заполните её командой seed_blog); запустите до и '
+        'после миграции индексов 0011, чтобы сравнить их.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--deep-page', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        latest = get_res_qs(Post.objects).first()
+        if latest is None:
+            self.stderr.write('Нет опубликованных постов.')
+            return
+        feed = get_res_qs(Post.objects)
+        # The deep page is capped at the last one on smaller databases.
+        last_page = (feed.count() - 1) // POST_PER_PAGES
+        offset = min(options['deep_page'], last_page) * POST_PER_PAGES
+        paginator = KeysetPaginator(feed, POST_PER_PAGES)
+        deep_post = feed[offset:offset + 1].get()
+        commented = Post.objects.order_by('-comment_count').first()
+        queries = {
+            'index': feed[:POST_PER_PAGES],
+            'index_offset_page': feed[offset:offset + POST_PER_PAGES],
+            'index_keyset_page': paginator.seek(
+                [getattr(deep_post, name) for name in paginator.fields],
+            )[:POST_PER_PAGES],
+            'category': get_res_qs(
+                latest.category.posts_in_category,
+            )[:POST_PER_PAGES],
+            'profile': Post.objects.filter(
+                author=latest.author,
+            ).order_by('-pub_date', '-id')[:POST_PER_PAGES],
+            'comments': Comment.objects.filter(
+                post=commented,
+            ).select_related('author')[:POST_PER_PAGES],
+        }
+        for name, queryset in queries.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(queryset.explain())
+            self.stdout.write(
+                f'best of {options["repeat"]}: '
+                f'{self.measure(queryset, options["repeat"]):.2f} ms\n'
+            )
+
+    def measure(self, queryset, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            list(queryset.all())
+            timings.append((time.perf_counter() - started) * 1000)
+        return min(timings)
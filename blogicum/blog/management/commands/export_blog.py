@@ -0,0 +1,44 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from blog.config import EXPORT_CHUNK_SIZE
+from blog.export import EXPORTS, FORMATS, export_lines, export_queryset
+
+
+class Command(BaseCommand):
+    help = (
+        'Выгружает публикации, комментарии, категории или местоположения '
+        'в NDJSON или CSV, не загружая всю таблицу в память.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('name', choices=EXPORTS)
+        parser.add_argument('--format', choices=FORMATS, default='ndjson')
+        parser.add_argument('--since', type=date.fromisoformat)
+        parser.add_argument('--until', type=date.fromisoformat)
+        parser.add_argument('--category', help='Слаг категории.')
+        parser.add_argument('--output', help='Файл; по умолчанию stdout.')
+        parser.add_argument(
+            '--chunk-size', type=int, default=EXPORT_CHUNK_SIZE,
+        )
+
+    def handle(self, *args, **options):
+        queryset = export_queryset(
+            options['name'],
+            since=options['since'],
+            until=options['until'],
+            category=options['category'],
+        )
+        lines = export_lines(
+            options['name'], queryset, options['format'],
+            chunk_size=options['chunk_size'],
+        )
+        if not options['output']:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+        with open(
+            options['output'], 'w', encoding='utf-8', newline='',
+        ) as output:
+            output.writelines(lines)
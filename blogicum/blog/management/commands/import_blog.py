@@ -0,0 +1,79 @@
+import sys
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.config import IMPORT_BATCH_SIZE
+from blog.export import FORMATS
+from blog.imports import IMPORTERS, batches, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        'Загружает категории, местоположения, публикации или комментарии '
+        'из NDJSON или CSV, созданных export_blog, пакетами через '
+        'executemany. '
+        'Импортируйте в порядке: categories, locations, posts, comments.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('name', choices=IMPORTERS)
+        parser.add_argument('path', help='Файл или «-» для stdin.')
+        parser.add_argument(
+            '--format', choices=FORMATS,
+            help='По умолчанию определяется по расширению файла.',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=IMPORT_BATCH_SIZE,
+        )
+        parser.add_argument(
+            '--resume', action='store_true',
+            help='Пропускать строки, id которых уже есть в базе.',
+        )
+
+    def handle(self, *args, **options):
+        import_format = options['format'] or (
+            'csv' if options['path'].endswith('.csv') else 'ndjson'
+        )
+        importer = IMPORTERS[options['name']](resume=options['resume'])
+        if options['path'] == '-':
+            total, seconds = self.run(importer, sys.stdin, import_format,
+                                      options['batch_size'])
+        else:
+            try:
+                file = Path(options['path']).open(
+                    encoding='utf-8', newline='',
+                )
+            except OSError as error:
+                raise CommandError(error)
+            with file:
+                total, seconds = self.run(importer, file, import_format,
+                                          options['batch_size'])
+        importer.finish()
+        self.stdout.write(self.style.SUCCESS(
+            f'Импортировано: {total}, пропущено: {importer.skipped}, '
+            f'{total / max(seconds, 1e-9):.0f} строк/с'
+        ))
+        if getattr(importer, 'orphans', 0):
+            self.stdout.write(self.style.WARNING(
+                f'Комментариев к отсутствующим публикациям: '
+                f'{importer.orphans}'
+            ))
+        if options['name'] == 'posts':
+            self.stdout.write(
+                'Уменьшенные копии фото создаёт команда build_renditions.'
+            )
+
+    def run(self, importer, file, import_format, batch_size):
+        total = 0
+        started = time.perf_counter()
+        for batch in batches(read_rows(file, import_format), batch_size):
+            total += importer.import_batch(batch)
+            seconds = time.perf_counter() - started
+            self.stderr.write(
+                f'\r{total} строк, {total / max(seconds, 1e-9):.0f} строк/с',
+                ending='',
+            )
+        self.stderr.write('')
+        return total, time.perf_counter() - started
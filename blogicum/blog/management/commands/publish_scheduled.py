@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from blog.cache import NO_BOUNDARY, get_publication_boundary
+from blog.config import PUBLISH_POLL_INTERVAL
+
+
+class Command(BaseCommand):
+    help = (
+        'Открывает отложенные публикации в момент наступления их pub_date и '
+        'сбрасывает кэш их лент. Без --once работает, пока процесс не '
+        'остановят.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--poll-interval', type=float, default=PUBLISH_POLL_INTERVAL,
+            help='Как часто проверять, не появились ли более ранние '
+            'отложенные публикации.',
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Открыть наступившие публикации и завершиться.',
+        )
+
+    def handle(self, *args, **options):
+        if options['once']:
+            self.report(get_publication_boundary())
+            return
+        try:
+            while True:
+                close_old_connections()
+                boundary = get_publication_boundary()
+                wait = (boundary - timezone.now()).total_seconds()
+                time.sleep(min(max(wait, 0), options['poll_interval']))
+        except KeyboardInterrupt:
+            pass
+
+    def report(self, boundary):
+        if boundary == NO_BOUNDARY:
+            self.stdout.write(self.style.SUCCESS('Отложенных публикаций нет'))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'Следующая публикация откроется {boundary.isoformat()}'
+            ))
@@ -0,0 +1,58 @@
+import threading
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from blog.config import TASK_POLL_INTERVAL
+from blog.tasks import DatabaseBackend
+
+
+class Command(BaseCommand):
+    help = (
+        'Выполняет фоновые задачи, сохранённые DatabaseBackend. Без --once '
+        'работает, пока процесс не остановят.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1)
+        parser.add_argument(
+            '--poll-interval', type=float, default=TASK_POLL_INTERVAL,
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Выполнить готовые к запуску задачи и завершиться.',
+        )
+
+    def handle(self, *args, **options):
+        backend = DatabaseBackend()
+        if options['once']:
+            done = 0
+            while backend.run_next():
+                done += 1
+            self.stdout.write(
+                self.style.SUCCESS(f'Выполнено задач: {done}')
+            )
+            return
+        stop = threading.Event()
+        threads = [
+            threading.Thread(
+                target=self.work,
+                args=(backend, stop, options['poll_interval']),
+            )
+            for _ in range(options['workers'])
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def work(self, backend, stop, poll_interval):
+        try:
+            backend.work(stop, poll_interval)
+        finally:
+            connection.close()
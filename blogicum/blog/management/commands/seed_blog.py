@@ -0,0 +1,149 @@
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+from django.utils import timezone
+
+from blog.config import IMPORT_BATCH_SIZE
+from blog.imports import IMPORTERS, batches
+from blog.models import Category, Location, Post
+
+WORDS = (
+    'город', 'море', 'горы', 'лес', 'река', 'дорога', 'поезд', 'утро',
+    'вечер', 'книга', 'кофе', 'музыка', 'друзья', 'работа', 'отпуск',
+    'снег', 'дождь', 'солнце', 'ветер', 'озеро', 'парк', 'музей', 'рынок',
+    'кухня', 'рецепт', 'велосипед', 'поход', 'палатка', 'закат', 'рассвет',
+    'кино', 'театр', 'выставка', 'фото', 'улица', 'мост', 'остров', 'берег',
+    'тропа', 'вершина',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Заполняет базу синтетическими пользователями, категориями, '
+        'публикациями и комментариями для бенчмарков. При одинаковом '
+        '--seed данные совпадают. Повторный запуск добавляет публикации и '
+        'комментарии к уже созданным.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--locations', type=int, default=50)
+        parser.add_argument('--posts', type=int, default=10000)
+        parser.add_argument('--comments', type=int, default=50000)
+        parser.add_argument(
+            '--scheduled', type=float, default=0.01,
+            help='Доля отложенных публикаций.',
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--batch-size', type=int, default=IMPORT_BATCH_SIZE,
+        )
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options['seed'])
+        self.now = timezone.now()
+        started = time.perf_counter()
+        categories = self.seed_categories(options['categories'])
+        locations = self.seed_locations(options['locations'])
+        usernames = [f'bench_{number}' for number in range(options['users'])]
+        first_post = (Post.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+        self.load('posts', self.post_rows(
+            options['posts'], usernames, categories, locations,
+            options['scheduled'],
+        ), options['batch_size'])
+        last_post = Post.objects.aggregate(last=Max('pk'))['last'] or 0
+        if last_post >= first_post:
+            self.load('comments', self.comment_rows(
+                options['comments'], usernames, first_post, last_post,
+            ), options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Готово за {time.perf_counter() - started:.1f} с'
+        ))
+
+    def seed_categories(self, count):
+        Category.objects.bulk_create(
+            (
+                Category(
+                    title=f'Категория {number}',
+                    description=self.sentence(12),
+                    slug=f'bench-{number}',
+                    is_published=number % 10 != 9,
+                )
+                for number in range(count)
+            ),
+            ignore_conflicts=True,
+        )
+        return [f'bench-{number}' for number in range(count)]
+
+    def seed_locations(self, count):
+        names = [f'Место {number}' for number in range(count)]
+        existing = set(Location.objects.filter(
+            name__in=names,
+        ).values_list('name', flat=True))
+        Location.objects.bulk_create(
+            Location(name=name) for name in names if name not in existing
+        )
+        return list(Location.objects.filter(
+            name__in=names,
+        ).values_list('id', flat=True))
+
+    def load(self, name, rows, batch_size):
+        importer = IMPORTERS[name]()
+        total = 0
+        started = time.perf_counter()
+        for batch in batches(rows, batch_size):
+            total += importer.import_batch(batch)
+            seconds = time.perf_counter() - started
+            self.stderr.write(
+                f'\r{name}: {total}, {total / max(seconds, 1e-9):.0f} '
+                f'строк/с',
+                ending='',
+            )
+        self.stderr.write('')
+        importer.finish()
+
+    def sentence(self, words):
+        return ' '.join(self.random.choices(WORDS, k=words)).capitalize()
+
+    def post_rows(self, count, usernames, categories, locations, scheduled):
+        for _ in range(count):
+            if self.random.random() < scheduled:
+                pub_date = self.now + timedelta(
+                    minutes=self.random.randint(1, 60 * 24 * 30),
+                )
+            else:
+                pub_date = self.now - timedelta(
+                    minutes=self.random.randint(1, 60 * 24 * 365),
+                )
+            yield {
+                'title': self.sentence(self.random.randint(2, 6)),
+                'text': self.sentence(self.random.randint(20, 80)),
+                'pub_date': pub_date,
+                'created_at': pub_date,
+                'updated_at': pub_date,
+                'is_published': self.random.random() > 0.02,
+                'author_username': self.random.choice(usernames),
+                'category_slug': self.random.choice(categories),
+                'location_id': (
+                    self.random.choice(locations)
+                    if self.random.random() < 0.5 else None
+                ),
+            }
+
+    def comment_rows(self, count, usernames, first_post, last_post):
+        span = last_post - first_post + 1
+        for _ in range(count):
+            yield {
+                # Squaring skews comments towards a few popular posts.
+                'post_id': first_post + int(span * self.random.random() ** 2),
+                'author_username': self.random.choice(usernames),
+                'text': self.sentence(self.random.randint(3, 30)),
+                'is_published': True,
+                'created_at': self.now - timedelta(
+                    minutes=self.random.randint(1, 60 * 24 * 365),
+                ),
+            }
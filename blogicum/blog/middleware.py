@@ -0,0 +1,86 @@
+import json
+import logging
+
+from django.conf import settings
+
+from .config import PRIMARY_PIN_COOKIE, PRIMARY_PIN_SECONDS
+from .routers import read_replica, use_replica
+from .timing import Timing, stats
+
+logger = logging.getLogger('blog.timing')
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaRoutingMiddleware:
+    """Route reads of views with ``replica_reads = True`` to replicas.
+
+    After a write the client is pinned to the primary for
+    PRIMARY_PIN_SECONDS, so the redirect that follows reads its own write.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.replica_reads_token = None
+        try:
+            response = self.get_response(request)
+        finally:
+            if request.replica_reads_token is not None:
+                read_replica.reset(request.replica_reads_token)
+        if request.method not in SAFE_METHODS:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                '1',
+                max_age=PRIMARY_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Class-based views expose their class; Feed instances are the view.
+        view_class = getattr(view_func, 'view_class', view_func)
+        if (
+            request.method in SAFE_METHODS
+            and getattr(view_class, 'replica_reads', False)
+            and PRIMARY_PIN_COOKIE not in request.COOKIES
+        ):
+            request.replica_reads_token = use_replica()
+
+
+class TimingMiddleware:
+    """Measure every request and report it in the Server-Timing header.
+
+    The timings also feed the per-view percentiles served to staff at
+    /timings/ and, with BLOG_TIMING_LOG, are logged as JSON.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with Timing() as timing:
+            request.timing = timing
+            response = self.get_response(request)
+        view_name = getattr(request.resolver_match, 'view_name', None)
+        if view_name is not None:
+            stats.add(view_name, timing)
+        response['Server-Timing'] = timing.server_timing()
+        if settings.BLOG_TIMING_LOG:
+            logger.info(json.dumps({
+                'view': view_name,
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                **timing.as_dict(),
+            }))
+        return response
+
+    def process_template_response(self, request, response):
+        request.timing.mark_render_start()
+        response.add_post_render_callback(
+            lambda rendered: request.timing.mark_render_end()
+        )
+        return response
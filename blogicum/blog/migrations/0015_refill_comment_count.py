@@ -0,0 +1,28 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_comment_count(apps, schema_editor):
+    # 0009 filled the counts through the default database whatever
+    # database was migrated; count again on the one being migrated.
+    Comment = apps.get_model('blog', 'Comment')
+    Post = apps.get_model('blog', 'Post')
+    db_alias = schema_editor.connection.alias
+    counts = Comment.objects.using(db_alias).filter(
+        post=OuterRef('pk'),
+    ).order_by().values('post').annotate(total=Count('pk')).values('total')
+    Post.objects.using(db_alias).update(
+        comment_count=Coalesce(Subquery(counts), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_post_search'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_comment_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.16 on 2026-10-18 20:00
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0015_refill_comment_count'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='queuedtask',
+            name='run_after',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='Для выполняемой задачи — когда истекает её аренда.', verbose_name='Выполнить после'),
+        ),
+        migrations.AddIndex(
+            model_name='queuedtask',
+            index=models.Index(condition=models.Q(('status', 'running')), fields=['run_after', 'id'], name='running_task_lease_idx'),
+        ),
+    ]
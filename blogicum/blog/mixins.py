@@ -1,9 +1,56 @@
+from django.core.cache import cache
 from django.urls import reverse
-from django.shortcuts import get_object_or_404
+from django.http import Http404, HttpResponse
 from django.core.exceptions import PermissionDenied
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 
+from .cache import (
+    POST_CARD, feed_page_key, feed_validators, get_version, post_validators,
+)
+from .config import (
+    COMMENTS_PER_PAGE, FEED_COUNT_CACHE_TIMEOUT, FEED_PAGE_CACHE_TIMEOUT,
+    KEYSET_PAGINATION, POST_CARD_CACHE_TIMEOUT,
+)
 from .models import Post, Comment
 from .forms import PostForm, CommentForm
+from .paginators import (
+    CachedCountPaginator, InvalidCursor, KeysetPaginator,
+)
+
+
+class SingleObjectOnceMixin:
+
+    def get_object(self, queryset=None):
+        if getattr(self, '_object', None) is None:
+            self._object = super().get_object(queryset)
+        return self._object
+
+
+class PostVisibilityMixin(SingleObjectOnceMixin):
+    model = Post
+    pk_url_kwarg = 'id'
+    comments_per_page = COMMENTS_PER_PAGE
+
+    def get_queryset(self):
+        return Post.objects.select_related('category', 'location', 'author')
+
+    def dispatch(self, request, *args, **kwargs):
+        post = self.get_object()
+        if not post.is_published and post.author_id != request.user.id:
+            raise Http404
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_comments_page(self, cursor=None):
+        paginator = KeysetPaginator(
+            self.object.comments.select_related('author'),
+            self.comments_per_page,
+            ordering=('created_at', 'id'),
+        )
+        try:
+            return paginator.page(cursor)
+        except InvalidCursor as error:
+            raise Http404(str(error))
 
 
 class PostFormMixin:
@@ -26,12 +73,150 @@ class CommentFormMixin:
         )
 
 
-class CommentFormEditMixin(CommentFormMixin):
+class CommentFormEditMixin(SingleObjectOnceMixin, CommentFormMixin):
 
     def dispatch(self, request, *args, **kwargs):
-        instance = get_object_or_404(
-            Comment, id=self.kwargs.get(self.pk_url_kwarg)
-        )
-        if instance.author != request.user:
+        if self.get_object().author_id != request.user.id:
             raise PermissionDenied
         return super().dispatch(request, *args, **kwargs)
+
+
+class KeysetPaginationMixin:
+    keyset_pagination = KEYSET_PAGINATION
+    keyset_ordering = ('-pub_date', '-id')
+    cursor_kwarg = 'cursor'
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.keyset_pagination:
+            return super().paginate_queryset(queryset, page_size)
+        paginator = KeysetPaginator(queryset, page_size, self.keyset_ordering)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor as error:
+            raise Http404(str(error))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['paginator_template'] = (
+            'includes/keyset_paginator.html' if self.keyset_pagination
+            else 'includes/paginator.html'
+        )
+        page = context.get('page_obj')
+        if not self.keyset_pagination and page is not None:
+            # A link per page made the template loop over every page of
+            # the feed on each render.
+            context['page_range'] = page.paginator.get_elided_page_range(
+                page.number,
+            )
+        return context
+
+
+class CachedCountPaginationMixin:
+    count_cache_key = None
+    count_cache_timeout = FEED_COUNT_CACHE_TIMEOUT
+
+    def get_count_cache_key(self):
+        return self.count_cache_key
+
+    def get_paginator(self, queryset, per_page, orphans=0,
+                      allow_empty_first_page=True, **kwargs):
+        if self.get_count_cache_key() is None:
+            return super().get_paginator(
+                queryset, per_page, orphans=orphans,
+                allow_empty_first_page=allow_empty_first_page, **kwargs,
+            )
+        return CachedCountPaginator(
+            queryset,
+            per_page,
+            cache_key=self.get_count_cache_key(),
+            timeout=self.count_cache_timeout,
+            orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+            **kwargs,
+        )
+
+
+class PostCardCacheMixin:
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['post_card_cache_timeout'] = POST_CARD_CACHE_TIMEOUT
+        context['post_card_version'] = get_version(POST_CARD)
+        return context
+
+
+class FeedMixin:
+    page_cache_feed = None
+
+    def get_page_cache_feed(self):
+        return self.page_cache_feed
+
+
+class AnonymousPageCacheMixin(FeedMixin):
+    page_cache_timeout = FEED_PAGE_CACHE_TIMEOUT
+
+    def get(self, request, *args, **kwargs):
+        feed = self.get_page_cache_feed()
+        if request.user.is_authenticated or feed is None:
+            return super().get(request, *args, **kwargs)
+        key = feed_page_key(
+            feed,
+            request.GET.get(self.page_kwarg, 1),
+            request.GET.get('cursor', ''),
+        )
+        content = cache.get(key)
+        if content is not None:
+            return HttpResponse(content)
+        response = super().get(request, *args, **kwargs)
+
+        def store(rendered):
+            if rendered.status_code == 200:
+                cache.set(key, rendered.content, self.page_cache_timeout)
+
+        response.add_post_render_callback(store)
+        return response
+
+
+class ConditionalGetMixin:
+    """Answer with 304 while an anonymous visitor's copy is current.
+
+    get_validators() returns an ETag and a Last-Modified timestamp, or
+    None to skip the check, and must be cheaper than the page itself.
+    Pages of signed-in users carry their CSRF token, which changes on
+    login, so they are always rendered in full and get no validators.
+    """
+
+    def get_validators(self):
+        return None
+
+    def get(self, request, *args, **kwargs):
+        validators = (
+            None if request.user.is_authenticated else self.get_validators()
+        )
+        if validators is None:
+            return super().get(request, *args, **kwargs)
+        etag, last_modified = validators
+        etag = quote_etag(etag)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified,
+        )
+        if response is not None:
+            return response
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+
+class PostConditionalGetMixin(ConditionalGetMixin):
+
+    def get_validators(self):
+        return post_validators(self.get_object().updated_at)
+
+
+class FeedConditionalGetMixin(ConditionalGetMixin, FeedMixin):
+
+    def get_validators(self):
+        return feed_validators(self.get_page_cache_feed())
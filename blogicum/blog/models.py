@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.urls import reverse
+from django.utils import timezone
 
 
 User = get_user_model()
@@ -52,6 +53,13 @@ class Location(BaseModel):
         return self.name
 
 
+class ImageStatus(models.TextChoices):
+    NONE = '', 'Нет фото'
+    PENDING = 'pending', 'Обрабатывается'
+    READY = 'ready', 'Готово'
+    FAILED = 'failed', 'Ошибка обработки'
+
+
 class Post(BaseModel):
     title = models.CharField(max_length=256, verbose_name='Название')
     text = models.TextField(verbose_name='Текст')
@@ -83,14 +91,65 @@ class Post(BaseModel):
                               upload_to='posts_images',
                               blank=True,
                               )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Изменено',
+    )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев',
+    )
+    renditions = models.JSONField(
+        default=dict,
+        editable=False,
+        verbose_name='Уменьшенные копии фото',
+    )
+    image_status = models.CharField(
+        max_length=16,
+        choices=ImageStatus.choices,
+        default=ImageStatus.NONE,
+        blank=True,
+        editable=False,
+        verbose_name='Обработка фото',
+    )
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
+        indexes = (
+            models.Index(
+                fields=('-pub_date', '-id'),
+                condition=models.Q(is_published=True),
+                name='post_feed_idx',
+            ),
+            models.Index(
+                fields=('category', '-pub_date', '-id'),
+                condition=models.Q(is_published=True),
+                name='post_category_feed_idx',
+            ),
+            models.Index(
+                fields=('author', '-pub_date', '-id'),
+                name='post_author_feed_idx',
+            ),
+        )
 
     def get_absolute_url(self):
         return reverse('blog:post_detail', kwargs={'id': self.id})
 
+    @property
+    def image_renditions(self):
+        storage = self.image.storage
+        return {
+            name: {
+                **rendition,
+                'webp_url': storage.url(rendition['webp']),
+                'jpg_url': storage.url(rendition['jpg']),
+            }
+            for name, rendition in self.renditions.items()
+            if name != 'source'
+        }
+
     def __str__(self):
         return self.title
 
@@ -114,3 +173,60 @@ class Comment(BaseModel):
         ordering = ('created_at',)
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = (
+            models.Index(
+                fields=('post', 'created_at', 'id'),
+                name='comment_post_created_idx',
+            ),
+        )
+
+
+class TaskStatus(models.TextChoices):
+    QUEUED = 'queued', 'В очереди'
+    RUNNING = 'running', 'Выполняется'
+    DONE = 'done', 'Выполнена'
+    FAILED = 'failed', 'Ошибка'
+
+
+class QueuedTask(models.Model):
+    name = models.CharField(max_length=256, verbose_name='Задача')
+    args = models.JSONField(default=list, verbose_name='Аргументы')
+    status = models.CharField(
+        max_length=16,
+        choices=TaskStatus.choices,
+        default=TaskStatus.QUEUED,
+        verbose_name='Статус',
+    )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Попыток',
+    )
+    run_after = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='Выполнить после',
+        help_text='Для выполняемой задачи — когда истекает её аренда.',
+    )
+    last_error = models.TextField(blank=True, verbose_name='Ошибка')
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Добавлено',
+    )
+
+    class Meta:
+        verbose_name = 'фоновая задача'
+        verbose_name_plural = 'Фоновые задачи'
+        indexes = (
+            models.Index(
+                fields=('run_after', 'id'),
+                condition=models.Q(status='queued'),
+                name='queued_task_due_idx',
+            ),
+            models.Index(
+                fields=('run_after', 'id'),
+                condition=models.Q(status='running'),
+                name='running_task_lease_idx',
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.name}{tuple(self.args)}'
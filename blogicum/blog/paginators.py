@@ -0,0 +1,164 @@
+import base64
+import binascii
+import json
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage, Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from .encoders import PreciseJSONEncoder
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator taking its total from the cache instead of COUNT(*).
+
+    The exact count is only run when the key is cold; signal handlers drop
+    the key whenever a post or category of the feed changes.
+    """
+
+    def __init__(self, object_list, per_page, cache_key, timeout=None,
+                 **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cache_key = cache_key
+        self.timeout = timeout
+
+    @cached_property
+    def count(self):
+        count = cache.get(self.cache_key)
+        if count is None:
+            count = self.object_list.count()
+            cache.set(self.cache_key, count, self.timeout)
+        return count
+
+
+class KeysetPage:
+
+    def __init__(self, object_list, paginator,
+                 next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f'<Keyset page of {len(self)} objects>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """Cursor paginator seeking on an ordered tuple of columns.
+
+    Unlike django.core.paginator.Paginator it never issues OFFSET or
+    COUNT(*): each page is a single indexed range scan, whatever its depth.
+    The last ordering column must be unique (usually ``id``).
+    """
+
+    def __init__(self, queryset, per_page, ordering=('-pub_date', '-id')):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.fields = tuple(name.lstrip('-') for name in self.ordering)
+
+    def page(self, cursor=None):
+        reverse, values = self.decode_cursor(cursor) if cursor else (
+            False, None,
+        )
+        rows = list(self.seek(values, reverse)[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if reverse:
+            rows.reverse()
+        if not rows:
+            return KeysetPage(rows, self)
+        if reverse:
+            next_cursor = self.encode_cursor(rows[-1])
+            previous_cursor = (
+                self.encode_cursor(rows[0], reverse=True) if has_more
+                else None
+            )
+        else:
+            next_cursor = self.encode_cursor(rows[-1]) if has_more else None
+            previous_cursor = (
+                self.encode_cursor(rows[0], reverse=True)
+                if values is not None else None
+            )
+        return KeysetPage(rows, self, next_cursor, previous_cursor)
+
+    def encode_cursor(self, obj, reverse=False):
+        values = [
+            obj[name] if isinstance(obj, dict) else getattr(obj, name)
+            for name in self.fields
+        ]
+        payload = json.dumps(
+            [int(reverse), values],
+            cls=PreciseJSONEncoder,
+            separators=(',', ':'),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            payload = base64.urlsafe_b64decode(
+                cursor + '=' * (-len(cursor) % 4)
+            )
+            reverse, raw_values = json.loads(payload)
+            if len(raw_values) != len(self.fields):
+                raise ValueError('Cursor does not match the ordering')
+            model_meta = self.queryset.model._meta
+            values = [
+                model_meta.get_field(name).to_python(value)
+                for name, value in zip(self.fields, raw_values)
+            ]
+        except (
+            binascii.Error, TypeError, ValueError, ValidationError,
+        ) as error:
+            raise InvalidCursor('Некорректный курсор страницы') from error
+        return bool(reverse), values
+
+    def seek(self, values=None, reverse=False):
+        queryset = self.queryset.order_by(*self._get_ordering(reverse))
+        if values is not None:
+            queryset = queryset.filter(self._seek_condition(values, reverse))
+        return queryset
+
+    def _get_ordering(self, reverse):
+        if not reverse:
+            return self.ordering
+        return tuple(
+            name[1:] if name.startswith('-') else f'-{name}'
+            for name in self.ordering
+        )
+
+    def _seek_condition(self, values, reverse):
+        condition = Q()
+        for index, ordering in enumerate(self.ordering):
+            descending = ordering.startswith('-') != reverse
+            lookup = 'lt' if descending else 'gt'
+            step = Q(**{f'{self.fields[index]}__{lookup}': values[index]})
+            for name, value in zip(self.fields[:index], values[:index]):
+                step &= Q(**{name: value})
+            condition |= step
+        return condition
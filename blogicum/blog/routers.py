@@ -0,0 +1,53 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+# The replica serving the reads of the current request, if any.
+read_replica = ContextVar('read_replica', default=None)
+
+
+def get_replicas():
+    return getattr(settings, 'DATABASE_REPLICAS', ())
+
+
+def use_replica():
+    """Pick one replica for the rest of the context and return the token.
+
+    Replicas lag behind the primary by different amounts, so all reads of
+    one request go to the same replica to render a consistent page.
+    """
+    replicas = get_replicas()
+    return read_replica.set(random.choice(replicas) if replicas else None)
+
+
+@contextmanager
+def replica_reads():
+    token = use_replica()
+    try:
+        yield
+    finally:
+        read_replica.reset(token)
+
+
+class ReplicaRouter:
+    """Send reads to the replica chosen by use_replica(), if any.
+
+    Writes never go to a replica, even for objects that were read from one.
+    """
+
+    def db_for_read(self, model, **hints):
+        return read_replica.get()
+
+    def db_for_write(self, model, **hints):
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db in get_replicas():
+            return 'default'
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {'default', *get_replicas()}
+        if {obj1._state.db, obj2._state.db} <= databases:
+            return True
+        return None
@@ -0,0 +1,96 @@
+import re
+
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .config import (
+    SEARCH_CHUNK_SIZE, SEARCH_MAX_CANDIDATES, SEARCH_MAX_TERMS,
+    SEARCH_WEIGHTS,
+)
+
+FTS_TABLE = 'blog_post_fts'
+
+WORD_RE = re.compile(r'\w+')
+
+
+def get_terms(text):
+    return WORD_RE.findall(text.lower())[:SEARCH_MAX_TERMS]
+
+
+def get_match_expression(terms):
+    """Build an FTS5 query matching every term.
+
+    Each term is quoted, so operators typed by the reader are searched for
+    as plain words instead of being interpreted by FTS5.
+    """
+    return ' '.join(f'"{term}"' for term in terms)
+
+
+def get_candidate_floor(queryset, match):
+    """Return the lowest id among the newest visible matches.
+
+    Matches are read newest first and checked against ``queryset`` a
+    chunk at a time, so posts hidden from it never use up the
+    SEARCH_MAX_CANDIDATES candidates. Returns 0 when there are fewer
+    visible matches than that.
+    """
+    found = 0
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s '
+            f'ORDER BY rowid DESC',
+            [match],
+        )
+        while chunk := [pk for pk, in cursor.fetchmany(SEARCH_CHUNK_SIZE)]:
+            visible = sorted(
+                queryset.filter(pk__in=chunk).values_list('pk', flat=True),
+                reverse=True,
+            )
+            if found + len(visible) >= SEARCH_MAX_CANDIDATES:
+                return visible[SEARCH_MAX_CANDIDATES - found - 1]
+            found += len(visible)
+    return 0
+
+
+def search_posts(queryset, text):
+    """Filter posts by a reader's query, best matches first.
+
+    On SQLite the FTS5 index created by migration 0014 is used and the
+    results are ranked with bm25 weighted by SEARCH_WEIGHTS. Scoring costs
+    about as much per matching row as a page of the feed, so only the
+    newest SEARCH_MAX_CANDIDATES matches that ``queryset`` lets through
+    are ranked: a word found in most posts still answers in milliseconds.
+    Other backends fall back to a substring search ordered by date.
+    """
+    terms = get_terms(text)
+    if not terms:
+        return queryset.none()
+    connection = connections[queryset.db]
+    if connection.vendor != 'sqlite':
+        condition = Q()
+        for term in terms:
+            condition &= Q(title__icontains=term) | Q(text__icontains=term)
+        return queryset.filter(condition)
+    match = get_match_expression(terms)
+    floor = get_candidate_floor(queryset, match)
+    # bm25() only works in the query that runs MATCH, and a correlated
+    # subquery would run it again for every post; the scores are
+    # computed once into a CTE. SQLite 3.35 inlines a CTE used once
+    # unless it is marked MATERIALIZED, older versions always keep it.
+    materialized = (
+        'MATERIALIZED ' if connection.Database.sqlite_version_info
+        >= (3, 35) else ''
+    )
+    return queryset.filter(pk__in=RawSQL(
+        f'SELECT rowid FROM {FTS_TABLE} '
+        f'WHERE {FTS_TABLE} MATCH %s AND rowid >= %s',
+        [match, floor],
+    )).annotate(rank=RawSQL(
+        f'WITH ranks AS {materialized}('
+        f'SELECT rowid, bm25({FTS_TABLE}, %s, %s) AS rank FROM {FTS_TABLE} '
+        f'WHERE {FTS_TABLE} MATCH %s AND rowid >= %s) '
+        f'SELECT rank FROM ranks '
+        f'WHERE ranks.rowid = {queryset.model._meta.db_table}.id',
+        [*SEARCH_WEIGHTS, match, floor],
+    )).order_by('rank', '-pub_date', '-id')
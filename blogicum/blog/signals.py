@@ -0,0 +1,231 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import (
+    post_delete, post_save, pre_delete, pre_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .cache import (
+    POST_CARD, bump_versions, clear_category_map, feed_rows,
+    invalidate_feed_counts, invalidate_feeds, lower_publication_boundary,
+)
+from .images import renditions_are_stale, schedule_renditions
+from .models import Category, Comment, Location, Post, User
+from .suggest import suggestions
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+            cursor.execute(f'PRAGMA {pragma} = {value}')
+
+
+def is_login_update(update_fields):
+    return bool(update_fields) and set(update_fields) <= {'last_login'}
+
+
+@receiver(post_save, sender=Comment)
+def touch_commented_post(sender, instance, created, raw=False, **kwargs):
+    # Post.updated_at is the validator of the post page, so comment edits
+    # move it as well.
+    if raw:
+        return
+    if not created:
+        Post.objects.filter(pk=instance.post_id).update(
+            updated_at=timezone.now(),
+        )
+        return
+    Post.objects.filter(pk=instance.post_id).update(
+        comment_count=F('comment_count') + 1,
+        updated_at=timezone.now(),
+    )
+    invalidate_feeds(feed_rows(pk=instance.post_id), counts=False)
+
+
+# Posts and comment authors being deleted. Their comments go in the same
+# cascade, which would otherwise update a post and bump its feeds once
+# per comment.
+deleting_posts = set()
+deleting_authors = set()
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    if (
+        instance.post_id in deleting_posts
+        or instance.author_id in deleting_authors
+    ):
+        return
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1,
+        updated_at=timezone.now(),
+    )
+    invalidate_feeds(feed_rows(pk=instance.post_id), counts=False)
+
+
+@receiver(pre_save, sender=Post)
+@receiver(pre_delete, sender=Post)
+def remember_post_feeds(sender, instance, raw=False, **kwargs):
+    instance._saved_feed_rows = (
+        feed_rows(pk=instance.pk) if instance.pk and not raw else set()
+    )
+
+
+@receiver(pre_delete, sender=Post)
+def skip_deleted_post_comments(sender, instance, **kwargs):
+    deleting_posts.add(instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def forget_deleted_post(sender, instance, **kwargs):
+    deleting_posts.discard(instance.pk)
+
+
+@receiver(pre_delete, sender=User)
+def skip_deleted_author_comments(sender, instance, **kwargs):
+    deleting_authors.add(instance.pk)
+    instance._commented_post_ids = set(Comment.objects.filter(
+        author=instance,
+    ).values_list('post_id', flat=True))
+
+
+@receiver(post_delete, sender=User)
+def recount_deleted_author_comments(sender, instance, **kwargs):
+    deleting_authors.discard(instance.pk)
+    # One recount for every post the author commented on; posts of the
+    # author are gone by now and match nothing.
+    post_ids = instance._commented_post_ids
+    if not post_ids:
+        return
+    counts = Comment.objects.filter(
+        post=OuterRef('pk'),
+    ).order_by().values('post').annotate(total=Count('pk')).values('total')
+    Post.objects.filter(pk__in=post_ids).update(
+        comment_count=Coalesce(Subquery(counts), 0),
+        updated_at=timezone.now(),
+    )
+    invalidate_feeds(feed_rows(pk__in=post_ids), counts=False)
+
+
+@receiver(post_save, sender=Post)
+def schedule_post_image_renditions(sender, instance, raw=False, **kwargs):
+    if not raw and renditions_are_stale(instance):
+        schedule_renditions(instance)
+
+
+@receiver(post_save, sender=Post)
+def invalidate_saved_post_feeds(sender, instance, **kwargs):
+    invalidate_feeds(instance._saved_feed_rows | feed_rows(pk=instance.pk))
+    if instance.is_published:
+        lower_publication_boundary(instance.pub_date)
+
+
+@receiver(post_delete, sender=Post)
+def invalidate_deleted_post_feeds(sender, instance, **kwargs):
+    invalidate_feeds(instance._saved_feed_rows)
+
+
+@receiver(pre_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def remember_category_feeds(sender, instance, raw=False, **kwargs):
+    instance._saved_feed_rows = set()
+    instance._saved_slug = None
+    if instance.pk and not raw:
+        instance._saved_feed_rows = feed_rows(category_id=instance.pk)
+        instance._saved_slug = Category.objects.filter(
+            pk=instance.pk,
+        ).values_list('slug', flat=True).first()
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_feeds(sender, instance, **kwargs):
+    clear_category_map()
+    invalidate_feed_counts(instance.pk)
+    invalidate_feeds(
+        instance._saved_feed_rows,
+        category_slugs=(instance.slug, instance._saved_slug),
+    )
+    bump_versions(POST_CARD)
+
+
+@receiver(pre_save, sender=Location)
+@receiver(pre_delete, sender=Location)
+def remember_location_feeds(sender, instance, raw=False, **kwargs):
+    instance._saved_feed_rows = (
+        feed_rows(location_id=instance.pk) if instance.pk and not raw
+        else set()
+    )
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_location_feeds(sender, instance, **kwargs):
+    invalidate_feeds(instance._saved_feed_rows, counts=False)
+    bump_versions(POST_CARD)
+
+
+@receiver(pre_save, sender=User)
+def remember_author_feeds(sender, instance, raw=False, update_fields=None,
+                          **kwargs):
+    instance._saved_feed_rows = set()
+    instance._saved_username = None
+    if instance.pk and not raw and not is_login_update(update_fields):
+        instance._saved_feed_rows = feed_rows(author_id=instance.pk)
+        instance._saved_username = User.objects.filter(
+            pk=instance.pk,
+        ).values_list('username', flat=True).first()
+
+
+@receiver(post_save, sender=User)
+def invalidate_author_feeds(sender, instance, created, update_fields=None,
+                            **kwargs):
+    if created or is_login_update(update_fields):
+        return
+    invalidate_feeds(
+        instance._saved_feed_rows,
+        usernames=(instance.username, instance._saved_username),
+        counts=False,
+    )
+    bump_versions(POST_CARD)
+
+
+@receiver(post_save, sender=Post)
+def update_post_suggestions(sender, instance, raw=False, **kwargs):
+    if not raw:
+        suggestions.update_post(instance)
+
+
+@receiver(post_delete, sender=Post)
+def remove_post_suggestions(sender, instance, **kwargs):
+    suggestions.remove_post(instance.pk)
+
+
+@receiver(post_save, sender=Category)
+def update_category_suggestions(sender, instance, raw=False, **kwargs):
+    if not raw:
+        suggestions.update_category(instance)
+
+
+# Before the deletion, while its posts still refer to the category.
+@receiver(pre_delete, sender=Category)
+def remove_category_suggestions(sender, instance, **kwargs):
+    suggestions.remove_category(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def update_user_suggestions(sender, instance, raw=False, update_fields=None,
+                            **kwargs):
+    if not raw and not is_login_update(update_fields):
+        suggestions.update_user(instance)
+
+
+@receiver(post_delete, sender=User)
+def remove_user_suggestions(sender, instance, **kwargs):
+    suggestions.remove_user(instance.pk)
@@ -0,0 +1,276 @@
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+
+from .config import SUGGEST_INDEX_TIMEOUT, SUGGEST_LIMIT
+from .models import Category, Post, User
+
+
+def normalize(text):
+    return ' '.join(text.casefold().split())
+
+
+class PrefixIndex:
+    """Sorted array of (normalized key, pk) answering prefix queries.
+
+    A lookup is a binary search plus a scan of the matching run, so it
+    costs microseconds however many keys there are. ``labels`` keeps the
+    current key of every pk, which lets saves and deletes replace one
+    entry without a rebuild.
+    """
+
+    def __init__(self, items=()):
+        self.keys = []
+        self.labels = {}
+        self.lock = threading.Lock()
+        entries = sorted(
+            (normalize(label), pk, label) for pk, label in items
+        )
+        for key, pk, label in entries:
+            self.keys.append((key, pk))
+            self.labels[pk] = label
+
+    def add(self, pk, label):
+        with self.lock:
+            self._discard(pk)
+            insort(self.keys, (normalize(label), pk))
+            self.labels[pk] = label
+
+    def discard(self, pk):
+        with self.lock:
+            self._discard(pk)
+
+    def _discard(self, pk):
+        label = self.labels.pop(pk, None)
+        if label is None:
+            return
+        entry = (normalize(label), pk)
+        index = bisect_left(self.keys, entry)
+        if index < len(self.keys) and self.keys[index] == entry:
+            del self.keys[index]
+
+    def search(self, prefix, limit, accept=None):
+        found = []
+        with self.lock:
+            index = bisect_left(self.keys, (prefix,))
+            while index < len(self.keys) and len(found) < limit:
+                key, pk = self.keys[index]
+                if not key.startswith(prefix):
+                    break
+                if accept is None or accept(pk):
+                    found.append((pk, self.labels[pk]))
+                index += 1
+        return found
+
+
+class SuggestionIndexes:
+    """Prefix indexes of one snapshot, with the edits that keep it current.
+
+    Only scheduled posts need their date checked on lookup; loading the
+    dates of all posts would double the build time.
+    """
+
+    def __init__(self):
+        self.posts = PrefixIndex()
+        self.categories = PrefixIndex()
+        self.users = PrefixIndex()
+        self.scheduled = {}
+        self.category_slugs = {}
+
+    @classmethod
+    def load(cls):
+        indexes = cls()
+        published_categories = Category.objects.filter(is_published=True)
+        posts = Post.objects.filter(
+            is_published=True, category__is_published=True,
+        )
+        indexes.posts = PrefixIndex(
+            posts.values_list('id', 'title').iterator()
+        )
+        indexes.categories = PrefixIndex(
+            published_categories.values_list('id', 'title')
+        )
+        indexes.users = PrefixIndex(
+            User.objects.filter(is_active=True).values_list(
+                'id', 'username',
+            )
+        )
+        indexes.scheduled = dict(posts.filter(
+            pub_date__gte=timezone.now(),
+        ).values_list('id', 'pub_date'))
+        indexes.category_slugs = dict(
+            published_categories.values_list('id', 'slug')
+        )
+        return indexes
+
+    def update_post(self, post):
+        self.scheduled.pop(post.pk, None)
+        if post.is_published and post.category_id in self.category_slugs:
+            if post.pub_date >= timezone.now():
+                self.scheduled[post.pk] = post.pub_date
+            self.posts.add(post.pk, post.title)
+        else:
+            self.posts.discard(post.pk)
+
+    def remove_post(self, pk):
+        self.posts.discard(pk)
+        self.scheduled.pop(pk, None)
+
+    def update_category(self, category):
+        if not category.is_published:
+            self.remove_category(category.pk)
+            return
+        hidden = category.pk not in self.category_slugs
+        self.category_slugs[category.pk] = category.slug
+        self.categories.add(category.pk, category.title)
+        if hidden:
+            # Publishing a category shows all of its published posts.
+            for post in Post.objects.filter(
+                category=category, is_published=True,
+            ).only('id', 'title', 'pub_date', 'is_published', 'category'):
+                self.update_post(post)
+
+    def remove_category(self, pk):
+        if self.category_slugs.pop(pk, None) is None:
+            return
+        self.categories.discard(pk)
+        for post_pk in Post.objects.filter(
+            category_id=pk,
+        ).values_list('id', flat=True):
+            self.remove_post(post_pk)
+
+    def update_user(self, user):
+        if user.is_active:
+            self.users.add(user.pk, user.username)
+        else:
+            self.users.discard(user.pk)
+
+    def remove_user(self, pk):
+        self.users.discard(pk)
+
+
+class Suggestions:
+    """Per-process prefix indexes of visible posts, categories and users.
+
+    Signal handlers of this process update the indexes in place; changes
+    made by other processes are picked up by a full rebuild every
+    SUGGEST_INDEX_TIMEOUT seconds. A lookup starts the rebuild in a
+    thread and the old indexes keep answering, empty before the first
+    build. Edits made while a build reads the database are replayed on
+    the new indexes before they replace the old ones.
+    """
+
+    def __init__(self):
+        self.rebuilding = threading.Lock()
+        self.updating = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.indexes = SuggestionIndexes()
+        self.pending = None
+        self.built_at = None
+
+    def build(self):
+        with self.updating:
+            self.pending = []
+        try:
+            indexes = SuggestionIndexes.load()
+            with self.updating:
+                for name, args in self.pending:
+                    getattr(indexes, name)(*args)
+                self.indexes = indexes
+                self.built_at = time.monotonic()
+        finally:
+            with self.updating:
+                self.pending = None
+
+    def rebuild_in_background(self):
+        if self.rebuilding.acquire(blocking=False):
+            threading.Thread(target=self._rebuild, daemon=True).start()
+
+    def ensure_fresh(self):
+        if (
+            self.built_at is None
+            or time.monotonic() - self.built_at > SUGGEST_INDEX_TIMEOUT
+        ):
+            self.rebuild_in_background()
+
+    def _rebuild(self):
+        try:
+            self.build()
+        finally:
+            connection.close()
+            self.rebuilding.release()
+
+    def search(self, text, limit=SUGGEST_LIMIT):
+        prefix = normalize(text)
+        if not prefix:
+            return {'posts': [], 'categories': [], 'users': []}
+        self.ensure_fresh()
+        indexes = self.indexes
+        now = timezone.now()
+        posts = indexes.posts.search(
+            prefix, limit,
+            lambda pk: (
+                pk not in indexes.scheduled or indexes.scheduled[pk] < now
+            ),
+        )
+        categories = indexes.categories.search(prefix, limit)
+        users = indexes.users.search(prefix, limit)
+        return {
+            'posts': [
+                {
+                    'title': title,
+                    'url': reverse('blog:post_detail', args=(pk,)),
+                }
+                for pk, title in posts
+            ],
+            'categories': [
+                {
+                    'title': title,
+                    'url': reverse(
+                        'blog:category_posts',
+                        args=(indexes.category_slugs[pk],),
+                    ),
+                }
+                for pk, title in categories
+            ],
+            'users': [
+                {
+                    'username': username,
+                    'url': reverse('blog:profile', args=(username,)),
+                }
+                for _, username in users
+            ],
+        }
+
+    def apply(self, name, *args):
+        with self.updating:
+            if self.pending is not None:
+                self.pending.append((name, args))
+            getattr(self.indexes, name)(*args)
+
+    def update_post(self, post):
+        self.apply('update_post', post)
+
+    def remove_post(self, pk):
+        self.apply('remove_post', pk)
+
+    def update_category(self, category):
+        self.apply('update_category', category)
+
+    def remove_category(self, pk):
+        self.apply('remove_category', pk)
+
+    def update_user(self, user):
+        self.apply('update_user', user)
+
+    def remove_user(self, pk):
+        self.apply('remove_user', pk)
+
+
+suggestions = Suggestions()
@@ -0,0 +1,196 @@
+import logging
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .config import (
+    TASK_LEASE_TIMEOUT, TASK_MAX_RETRIES, TASK_POLL_INTERVAL, TASK_RETRY_DELAY,
+)
+from .models import QueuedTask, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+
+
+class Task:
+    """Function that can be run later by the configured task backend.
+
+    Arguments must be JSON serialisable, the database backend stores them.
+    ``on_failure(args, error)`` is called once the retries are exhausted.
+    """
+
+    def __init__(self, func, max_retries=TASK_MAX_RETRIES,
+                 retry_delay=TASK_RETRY_DELAY, on_failure=None):
+        self.func = func
+        self.name = f'{func.__module__}.{func.__qualname__}'
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.on_failure = on_failure
+
+    def __call__(self, *args):
+        return self.func(*args)
+
+    def delay(self, *args):
+        get_backend().enqueue(self, list(args))
+
+    def get_retry_delay(self, attempt):
+        return self.retry_delay * 2 ** (attempt - 1)
+
+    def fail(self, args, error):
+        logger.error('Task %s%s failed', self.name, tuple(args),
+                     exc_info=error)
+        if self.on_failure is not None:
+            self.on_failure(args, error)
+
+
+def task(func=None, **options):
+    def register(func):
+        registered = Task(func, **options)
+        _registry[registered.name] = registered
+        return registered
+    return register(func) if func is not None else register
+
+
+def get_task(name):
+    return _registry[name]
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend():
+    path = settings.BLOG_TASK_BACKEND
+    with _backends_lock:
+        if path not in _backends:
+            _backends[path] = import_string(path)()
+        return _backends[path]
+
+
+class ImmediateBackend:
+    """Runs tasks synchronously; meant for tests and management commands."""
+
+    def enqueue(self, task, args):
+        for attempt in range(1, task.max_retries + 2):
+            try:
+                task(*args)
+                return
+            except Exception as error:
+                if attempt > task.max_retries:
+                    task.fail(args, error)
+
+
+class ThreadPoolBackend:
+    """Runs tasks in threads of the web process once the transaction commits.
+
+    Nothing survives a restart: use DatabaseBackend for durable work.
+    """
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'BLOG_TASK_THREADS', 2),
+            thread_name_prefix='blog-task',
+        )
+
+    def enqueue(self, task, args):
+        transaction.on_commit(
+            lambda: self.executor.submit(self.run, task, args)
+        )
+
+    def run(self, task, args):
+        try:
+            for attempt in range(1, task.max_retries + 2):
+                try:
+                    task(*args)
+                    return
+                except Exception as error:
+                    if attempt > task.max_retries:
+                        task.fail(args, error)
+                        return
+                    time.sleep(task.get_retry_delay(attempt))
+        finally:
+            connection.close()
+
+
+class DatabaseBackend:
+    """Stores tasks in QueuedTask; ``manage.py run_tasks`` executes them.
+
+    The row is written in the caller's transaction, so a task is queued if
+    and only if the change that requested it is committed.
+    """
+
+    def enqueue(self, task, args):
+        QueuedTask.objects.create(name=task.name, args=args)
+
+    def claim(self):
+        now = timezone.now()
+        # A claim leases the task until run_after. A running task whose
+        # lease expired was left behind by a worker that crashed or was
+        # killed, so it is claimed again before the queued ones.
+        for status in (TaskStatus.RUNNING, TaskStatus.QUEUED):
+            due = QueuedTask.objects.filter(
+                status=status, run_after__lte=now,
+            ).order_by('run_after', 'id').values_list('id', flat=True)
+            for pk in due[:10]:
+                claimed = QueuedTask.objects.filter(
+                    pk=pk, status=status, run_after__lte=now,
+                ).update(
+                    status=TaskStatus.RUNNING,
+                    attempts=F('attempts') + 1,
+                    run_after=now + timedelta(seconds=TASK_LEASE_TIMEOUT),
+                )
+                if claimed:
+                    return QueuedTask.objects.get(pk=pk)
+        return None
+
+    def run_next(self):
+        queued = self.claim()
+        if queued is None:
+            return False
+        try:
+            task = get_task(queued.name)
+        except KeyError:
+            queued.status = TaskStatus.FAILED
+            queued.last_error = f'Неизвестная задача {queued.name}'
+            queued.save(update_fields=('status', 'last_error'))
+            return True
+        if queued.attempts > task.max_retries + 1:
+            # Every attempt so far was lost together with its worker.
+            error = RuntimeError('Истекла аренда всех попыток')
+            queued.status = TaskStatus.FAILED
+            queued.last_error = str(error)
+            queued.save(update_fields=('status', 'last_error'))
+            task.fail(queued.args, error)
+            return True
+        try:
+            task(*queued.args)
+        except Exception as error:
+            queued.last_error = traceback.format_exc()
+            if queued.attempts > task.max_retries:
+                queued.status = TaskStatus.FAILED
+                task.fail(queued.args, error)
+            else:
+                queued.status = TaskStatus.QUEUED
+                queued.run_after = timezone.now() + timedelta(
+                    seconds=task.get_retry_delay(queued.attempts),
+                )
+        else:
+            queued.status = TaskStatus.DONE
+        queued.save(update_fields=('status', 'last_error', 'run_after'))
+        return True
+
+    def work(self, stop=None, poll_interval=TASK_POLL_INTERVAL):
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            close_old_connections()
+            if not self.run_next():
+                stop.wait(poll_interval)
@@ -0,0 +1,121 @@
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import ExitStack
+
+from django.db import connections
+
+from .config import TIMING_SAMPLES
+
+PERCENTILES = (50, 95, 99)
+
+
+class Timing:
+    """Count the queries of every database connection and time them.
+
+    Used as a context manager around a request or any other block of code;
+    ``mark_render_start()`` and ``mark_render_end()`` split the template
+    render time off the rest. Only the connections of the current thread
+    are observed.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.render_time = 0.0
+        self.render_db_time = 0.0
+        self.total = 0.0
+
+    def __enter__(self):
+        self.stack = ExitStack()
+        for connection in connections.all():
+            self.stack.enter_context(connection.execute_wrapper(self.record))
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.total = time.perf_counter() - self.started
+        self.stack.close()
+
+    def record(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - started
+
+    def mark_render_start(self):
+        self.render_started = (time.perf_counter(), self.db_time)
+
+    def mark_render_end(self):
+        started, db_time = self.render_started
+        # Querysets evaluated by the template count as database time.
+        self.render_db_time = self.db_time - db_time
+        self.render_time = (
+            time.perf_counter() - started - self.render_db_time
+        )
+
+    @property
+    def python_time(self):
+        return max(self.total - self.db_time - self.render_time, 0.0)
+
+    def as_dict(self):
+        return {
+            'queries': self.queries,
+            'total_ms': self.total * 1000,
+            'db_ms': self.db_time * 1000,
+            'render_ms': self.render_time * 1000,
+            'python_ms': self.python_time * 1000,
+        }
+
+    def server_timing(self):
+        return ', '.join((
+            f'db;dur={self.db_time * 1000:.1f};'
+            f'desc="{self.queries} queries"',
+            f'render;dur={self.render_time * 1000:.1f}',
+            f'python;dur={self.python_time * 1000:.1f}',
+            f'total;dur={self.total * 1000:.1f}',
+        ))
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of sorted values."""
+    return values[max(math.ceil(percent / 100 * len(values)) - 1, 0)]
+
+
+class TimingStats:
+    """Last TIMING_SAMPLES timings of each view in this process."""
+
+    def __init__(self, samples=TIMING_SAMPLES):
+        self.samples = samples
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.views = defaultdict(
+                lambda: deque(maxlen=self.samples)
+            )
+
+    def add(self, view_name, timing):
+        with self.lock:
+            self.views[view_name].append(timing.as_dict())
+
+    def summary(self):
+        with self.lock:
+            views = {name: list(rows) for name, rows in self.views.items()}
+        summary = {}
+        for name, rows in sorted(views.items()):
+            summary[name] = {'count': len(rows)}
+            for key in rows[0]:
+                values = sorted(row[key] for row in rows)
+                summary[name][key] = {
+                    f'p{percent}': round(percentile(values, percent), 2)
+                    for percent in PERCENTILES
+                }
+        return summary
+
+
+stats = TimingStats()
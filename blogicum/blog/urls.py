@@ -1,18 +1,24 @@
 from django.urls import path
 
-from . import views
+from . import api, feeds, views
 
 app_name = 'blog'
 
 urlpatterns = [
     path('profile/<str:username>/', views.UserView.as_view(),
          name='profile'),
+    path('profile/<str:username>/rss/', feeds.ProfilePostFeed(),
+         name='profile_rss'),
+    path('profile/<str:username>/atom/', feeds.AtomProfilePostFeed(),
+         name='profile_atom'),
     path('edit_profile/<username>/', views.UserUpdateView.as_view(),
          name='edit_profile'),
     path('posts/create/', views.PostCreateView.as_view(),
          name='create_post'),
     path('posts/<int:id>/', views.PostDetailView.as_view(),
          name='post_detail'),
+    path('posts/<int:id>/comments/', views.PostCommentsView.as_view(),
+         name='post_comments'),
     path('posts/<int:post_id>/edit/', views.PostUpdateView.as_view(),
          name='edit_post'),
     path('posts/<int:post_id>/delete/', views.PostDeleteView.as_view(),
@@ -27,5 +33,30 @@ urlpatterns = [
          name='delete_comment'),
     path('category/<slug:category_slug>/', views.CategoryListView.as_view(),
          name='category_posts'),
+    path('category/<slug:category_slug>/rss/', feeds.CategoryPostFeed(),
+         name='category_rss'),
+    path('category/<slug:category_slug>/atom/',
+         feeds.AtomCategoryPostFeed(),
+         name='category_atom'),
+    path('rss/', feeds.PostFeed(), name='index_rss'),
+    path('atom/', feeds.AtomPostFeed(), name='index_atom'),
+    path('search/', views.SearchView.as_view(), name='search'),
+    path('suggest/', views.SuggestView.as_view(), name='suggest'),
+    path('export/<str:name>/', views.ExportView.as_view(), name='export'),
+    path('timings/', views.TimingView.as_view(), name='timings'),
+    path('api/v1/posts/', api.PostListApiView.as_view(), name='api_posts'),
+    path('api/v1/posts/<int:id>/', api.PostApiView.as_view(),
+         name='api_post'),
+    path('api/v1/posts/<int:id>/comments/',
+         api.CommentListApiView.as_view(),
+         name='api_comments'),
+    path('api/v1/categories/', api.CategoryListApiView.as_view(),
+         name='api_categories'),
+    path('api/v1/categories/<slug:category_slug>/posts/',
+         api.CategoryPostListApiView.as_view(),
+         name='api_category_posts'),
+    path('api/v1/profiles/<str:username>/posts/',
+         api.ProfilePostListApiView.as_view(),
+         name='api_profile_posts'),
     path('', views.PostListView.as_view(), name='index')
 ]
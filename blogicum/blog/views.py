@@ -1,48 +1,66 @@
-from datetime import datetime
-
-from django.db.models import Count
-from django.http import Http404
-from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import (
+    Http404, HttpResponseBadRequest, JsonResponse, StreamingHttpResponse,
+)
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.core.exceptions import PermissionDenied
 from django.urls import reverse
 from django.shortcuts import get_object_or_404, redirect
 from django.views.generic import (
-    CreateView, ListView, UpdateView, DeleteView, DetailView,
+    CreateView, ListView, UpdateView, DeleteView, DetailView, View,
 )
 
+from .cache import (
+    INDEX_FEED, category_feed, feed_count_key, get_publication_boundary,
+    get_published_category, profile_feed,
+)
 from .config import POST_PER_PAGES
+from .export import EXPORTS, FORMATS, export_lines, export_queryset
 from .models import User, Post, Category
-from .forms import PostForm, ProfileForm, CommentForm
-from .mixins import PostFormMixin, CommentFormMixin, CommentFormEditMixin
+from .search import search_posts
+from .suggest import suggestions
+from .timing import stats
+from .forms import PostForm, ProfileForm, CommentForm, ExportForm
+from .mixins import (
+    PostFormMixin, CommentFormMixin, CommentFormEditMixin,
+    KeysetPaginationMixin, CachedCountPaginationMixin, PostCardCacheMixin,
+    AnonymousPageCacheMixin, SingleObjectOnceMixin, PostVisibilityMixin,
+    FeedConditionalGetMixin, PostConditionalGetMixin,
+)
 
 
 def get_res_qs(my_object):
     return my_object.filter(
         is_published=True,
-        pub_date__lt=datetime.now(),
+        pub_date__lt=get_publication_boundary(),
         category__is_published=True,).select_related(
             'category',
             'author',
             'location',
-    ).order_by('-pub_date')
+    ).order_by('-pub_date', '-id')
 
 
-def qs_with_cnt_comments(my_queryset):
-    return my_queryset.annotate(comment_count=Count('comments'),)
-
-
-class UserView(ListView):
+class UserView(
+    FeedConditionalGetMixin,
+    AnonymousPageCacheMixin,
+    PostCardCacheMixin,
+    KeysetPaginationMixin,
+    ListView,
+):
     model = Post
     template_name = 'blog/profile.html'
     paginate_by = POST_PER_PAGES
     slug_url_kwarg = 'username'
+    replica_reads = True
+
+    def get_page_cache_feed(self):
+        return profile_feed(self.kwargs.get(self.slug_url_kwarg))
 
     def get_queryset(self):
-        return qs_with_cnt_comments(
-            Post.objects.filter(
-                author__username=self.kwargs.get(self.slug_url_kwarg),
-            ).order_by('-pub_date')
-        )
+        return Post.objects.filter(
+            author__username=self.kwargs.get(self.slug_url_kwarg),
+        ).select_related(
+            'category', 'location', 'author',
+        ).order_by('-pub_date', '-id')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -54,7 +72,7 @@ class UserView(ListView):
         return context
 
 
-class UserUpdateView(LoginRequiredMixin, UpdateView):
+class UserUpdateView(SingleObjectOnceMixin, LoginRequiredMixin, UpdateView):
     template_name = 'blog/user.html'
     form_class = ProfileForm
     model = User
@@ -62,11 +80,7 @@ class UserUpdateView(LoginRequiredMixin, UpdateView):
     slug_url_kwarg = 'username'
 
     def dispatch(self, request, *args, **kwargs):
-        instance = get_object_or_404(
-            User,
-            username=self.kwargs.get(self.slug_url_kwarg)
-        )
-        if instance.username != request.user.username:
+        if self.get_object().username != request.user.username:
             raise PermissionDenied
         return super().dispatch(request, *args, **kwargs)
 
@@ -89,14 +103,12 @@ class PostCreateView(PostFormMixin, LoginRequiredMixin, CreateView):
         )
 
 
-class PostUpdateView(PostFormMixin, LoginRequiredMixin, UpdateView):
+class PostUpdateView(
+    SingleObjectOnceMixin, PostFormMixin, LoginRequiredMixin, UpdateView,
+):
 
     def dispatch(self, request, *args, **kwargs):
-        instance = get_object_or_404(
-            Post,
-            id=kwargs.get('post_id'),
-        )
-        if instance.author != request.user:
+        if self.get_object().author_id != request.user.id:
             return redirect(
                 reverse(
                     'blog:post_detail',
@@ -106,14 +118,12 @@ class PostUpdateView(PostFormMixin, LoginRequiredMixin, UpdateView):
         return super().dispatch(request, *args, **kwargs)
 
 
-class PostDeleteView(PostFormMixin, LoginRequiredMixin, DeleteView):
+class PostDeleteView(
+    SingleObjectOnceMixin, PostFormMixin, LoginRequiredMixin, DeleteView,
+):
 
     def dispatch(self, request, *args, **kwargs):
-        instance = get_object_or_404(
-            Post,
-            id=self.kwargs.get(self.pk_url_kwarg),
-        )
-        if instance.author != request.user:
+        if self.get_object().author_id != request.user.id:
             raise PermissionDenied
         return super().dispatch(request, *args, **kwargs)
 
@@ -132,62 +142,111 @@ class PostDeleteView(PostFormMixin, LoginRequiredMixin, DeleteView):
         )
 
 
-class PostListView(ListView):
+class PostListView(
+    FeedConditionalGetMixin,
+    AnonymousPageCacheMixin,
+    PostCardCacheMixin,
+    KeysetPaginationMixin,
+    CachedCountPaginationMixin,
+    ListView,
+):
     model = Post
     template_name = 'blog/index.html'
     paginate_by = POST_PER_PAGES
+    replica_reads = True
+    count_cache_key = feed_count_key()
+    page_cache_feed = INDEX_FEED
 
     def get_queryset(self):
-        return qs_with_cnt_comments(
-            get_res_qs(Post.objects)
-        )
+        return get_res_qs(Post.objects)
 
 
-class PostDetailView(DetailView):
+class SearchView(PostCardCacheMixin, ListView):
     model = Post
-    template_name = 'blog/detail.html'
-    pk_url_kwarg = 'id'
+    template_name = 'blog/search.html'
+    paginate_by = POST_PER_PAGES
+    replica_reads = True
+
+    def get_search_query(self):
+        return self.request.GET.get('q', '').strip()
+
+    def get_queryset(self):
+        return search_posts(get_res_qs(Post.objects), self.get_search_query())
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['query'] = self.get_search_query()
+        return context
 
-    def dispatch(self, request, *args, **kwargs):
-        instance = get_object_or_404(
-            Post,
-            id=self.kwargs.get(self.pk_url_kwarg),
-        )
-        if ~(instance.is_published) & (instance.author != request.user):
-            raise Http404
-        return super().dispatch(request, *args, **kwargs)
+
+class SuggestView(View):
+
+    def get(self, request):
+        return JsonResponse(suggestions.search(request.GET.get('q', '')))
+
+
+class PostDetailView(
+    PostConditionalGetMixin, PostVisibilityMixin, DetailView,
+):
+    template_name = 'blog/detail.html'
+    replica_reads = True
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = self.object.comments.select_related('author')
+        context['comments'] = self.get_comments_page()
+        return context
+
+
+class PostCommentsView(
+    PostConditionalGetMixin, PostVisibilityMixin, DetailView,
+):
+    template_name = 'includes/comment_list.html'
+    replica_reads = True
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['comments'] = self.get_comments_page(
+            self.request.GET.get('cursor'),
+        )
         return context
 
 
-class CategoryListView(ListView):
+class CategoryListView(
+    FeedConditionalGetMixin,
+    AnonymousPageCacheMixin,
+    PostCardCacheMixin,
+    KeysetPaginationMixin,
+    CachedCountPaginationMixin,
+    ListView,
+):
     model = Category
     template_name = 'blog/category.html'
     paginate_by = POST_PER_PAGES
     slug_url_kwarg = 'category_slug'
+    replica_reads = True
+
+    def get_category(self):
+        if getattr(self, 'category', None) is None:
+            self.category = get_published_category(
+                self.kwargs.get(self.slug_url_kwarg),
+            )
+            if self.category is None:
+                raise Http404
+        return self.category
 
     def get_queryset(self):
-        category = get_object_or_404(
-            Category,
-            slug=self.kwargs.get(self.slug_url_kwarg),
-            is_published='True',
-        )
-        return qs_with_cnt_comments(
-            get_res_qs(category.posts_in_category)
-        )
+        return get_res_qs(self.get_category().posts_in_category)
+
+    def get_count_cache_key(self):
+        return feed_count_key(self.get_category().id)
+
+    def get_page_cache_feed(self):
+        return category_feed(self.kwargs.get(self.slug_url_kwarg))
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        selected_category = get_object_or_404(
-            Category,
-            slug=self.kwargs.get(self.slug_url_kwarg),
-            is_published='True',
-        )
-        context['category'] = selected_category
+        context['category'] = self.get_category()
         return context
 
 
@@ -213,3 +272,44 @@ class CommentUpdateView(LoginRequiredMixin, CommentFormEditMixin, UpdateView):
 
 class CommentDeleteView(LoginRequiredMixin, CommentFormEditMixin, DeleteView):
     pass
+
+
+class ExportView(UserPassesTestMixin, View):
+    replica_reads = True
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get(self, request, name):
+        if name not in EXPORTS:
+            raise Http404
+        form = ExportForm(request.GET)
+        if not form.is_valid():
+            return HttpResponseBadRequest(form.errors.as_text())
+        export_format = form.cleaned_data['format'] or 'ndjson'
+        queryset = export_queryset(
+            name,
+            since=form.cleaned_data['since'],
+            until=form.cleaned_data['until'],
+            category=form.cleaned_data['category'],
+        )
+        # The body is produced after the view returns, when the replica
+        # routing context is already reset, so fix the database now.
+        queryset = queryset.using(queryset.db)
+        response = StreamingHttpResponse(
+            export_lines(name, queryset, export_format),
+            content_type=FORMATS[export_format],
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="blogicum-{name}.{export_format}"'
+        )
+        return response
+
+
+class TimingView(UserPassesTestMixin, View):
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get(self, request):
+        return JsonResponse(stats.summary())
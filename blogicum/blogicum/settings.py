@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -31,6 +32,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'blog.middleware.TimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -38,6 +40,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'blog.middleware.ReplicaRoutingMiddleware',
 ]
 
 ROOT_URLCONF = 'blogicum.urls'
@@ -73,10 +76,74 @@ WSGI_APPLICATION = 'blogicum.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.environ.get('BLOGICUM_DB', BASE_DIR / 'db.sqlite3'),
+        'CONN_MAX_AGE': 60,
     }
 }
 
+# Read replicas: comma-separated SQLite files kept in sync with the primary.
+for number, name in enumerate(
+    filter(None, os.environ.get('BLOGICUM_DB_REPLICAS', '').split(',')),
+    start=1,
+):
+    DATABASES[f'replica_{number}'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': name,
+        'CONN_MAX_AGE': 60,
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+
+DATABASE_ROUTERS = ['blog.routers.ReplicaRouter']
+
+# Applied to every new SQLite connection by blog.signals.configure_sqlite.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,
+    'busy_timeout': 20 * 1000,
+}
+
+
+# Feed versions, cached counts and pages, post card fragments and the
+# publication boundary are invalidated by whichever worker process saves
+# a change, so every process must read the same cache. Use memcached at
+# BLOGICUM_MEMCACHED (host:port) in production; the file cache is shared
+# by the processes of one host. A per-process LocMemCache would keep
+# serving stale pages in every worker but the one that saved the change.
+if os.environ.get('BLOGICUM_MEMCACHED'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': os.environ['BLOGICUM_MEMCACHED'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get(
+                'BLOGICUM_CACHE_DIR', BASE_DIR / 'cache',
+            ),
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+
+
+# blog.tasks.ThreadPoolBackend runs tasks inside the web process;
+# blog.tasks.DatabaseBackend stores them for `manage.py run_tasks`.
+BLOG_TASK_BACKEND = os.environ.get(
+    'BLOGICUM_TASK_BACKEND', 'blog.tasks.ThreadPoolBackend',
+)
+
+BLOG_TASK_THREADS = 2
+
+# Log the query count and timings of every request to the blog.timing
+# logger as JSON.
+BLOG_TIMING_LOG = os.environ.get('BLOGICUM_TIMING_LOG') == '1'
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
@@ -19,6 +19,7 @@ from typing import (
 import pytest
 from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db.models import Model, Field
 from django.forms import BaseForm
 from django.http import HttpResponse
@@ -29,6 +30,7 @@ from mixer.backend.django import mixer as _mixer
 N_PER_FIXTURE = 3
 N_PER_PAGE = 10
 COMMENT_TEXT_DISPLAY_LEN_FOR_TESTS = 50
+SESSION_AND_USER_QUERIES = 2
 
 KeyVal = NamedTuple("KeyVal", [("key", Optional[str]), ("val", Optional[str])])
 UrlRepr = NamedTuple("UrlRepr", [("url", str), ("repr", str)])
@@ -41,6 +43,43 @@ def enable_debug_false():
         yield
 
 
+@pytest.fixture(autouse=True)
+def immediate_tasks(settings):
+    settings.BLOG_TASK_BACKEND = "blog.tasks.ImmediateBackend"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_media_root(tmp_path_factory):
+    # Each pytest-xdist worker gets a temporary directory of its own, so
+    # parallel runs do not overwrite or clean up each other's uploads.
+    with override_settings(MEDIA_ROOT=tmp_path_factory.mktemp("media")):
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def locmem_cache():
+    # The project cache is shared between processes; each test process
+    # needs one of its own that clear_cache can empty.
+    with override_settings(CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "blogicum-tests",
+        }
+    }):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    from blog.cache import clear_category_map
+    from blog.suggest import suggestions
+
+    cache.clear()
+    clear_category_map()
+    suggestions.clear()
+    yield
+
+
 class SafeImportFromContextManager:
     def __init__(
             self,
@@ -92,6 +131,7 @@ pytest_plugins = [
     "fixtures.locations",
     "fixtures.categories",
     "fixtures.comments",
+    "fixtures.queries",
     "adapters.comment",
 ]
 
@@ -363,6 +403,7 @@ def cleanup(request):
                     filename.endswith(".jpg")
                     or filename.endswith(".gif")
                     or filename.endswith(".png")
+                    or filename.endswith(".webp")
             ):
                 file_path = os.path.join(root, filename)
                 if os.path.getmtime(file_path) >= start_time:
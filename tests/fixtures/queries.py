@@ -0,0 +1,74 @@
+from typing import Callable, List, Optional, Tuple
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudget:
+    """Records the SQL queries of single client requests.
+
+    ``assert_within`` fails when a request makes more queries than its
+    budget; ``assert_constant`` fails when the count of a page grows after
+    more rows are added to it, which is how an N+1 pattern shows up.
+    """
+
+    def count(
+        self, client: Client, url: str, method: str = "get",
+        data: Optional[dict] = None,
+    ) -> Tuple[HttpResponse, List[dict]]:
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(client, method)(url, data or {})
+        return response, context.captured_queries
+
+    def assert_within(
+        self, client: Client, url: str, budget: int, method: str = "get",
+        data: Optional[dict] = None,
+    ) -> HttpResponse:
+        response, queries = self.count(client, url, method, data)
+        assert len(queries) <= budget, (
+            f"Убедитесь, что запрос {method.upper()} `{url}` выполняет не "
+            f"больше {budget} запросов к базе данных, а не "
+            f"{len(queries)}:\n{self.format(queries)}"
+        )
+        return response
+
+    def assert_constant(
+        self, client: Client, url: str, grow: Callable[[], object],
+    ) -> int:
+        # Cached fragments would hide the queries of rendering each row,
+        # so both counts are taken with cold caches.
+        self.clear_caches()
+        _, before = self.count(client, url)
+        grow()
+        self.clear_caches()
+        _, after = self.count(client, url)
+        assert len(after) <= len(before), (
+            f"Убедитесь, что число запросов страницы `{url}` не растёт с "
+            f"числом объектов на ней: было {len(before)}, стало "
+            f"{len(after)}. Используйте select_related() или "
+            f"prefetch_related().\n{self.format(after)}"
+        )
+        return len(after)
+
+    @staticmethod
+    def clear_caches() -> None:
+        from blog.cache import clear_category_map
+
+        cache.clear()
+        clear_category_map()
+
+    @staticmethod
+    def format(queries: List[dict]) -> str:
+        return "\n".join(
+            f"{number}. {query['sql']}"
+            for number, query in enumerate(queries, start=1)
+        )
+
+
+@pytest.fixture
+def query_budget() -> QueryBudget:
+    return QueryBudget()
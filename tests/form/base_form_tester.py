@@ -88,7 +88,11 @@ class BaseFormTester(BaseTester):
     ):
         super().__init__(*args, **kwargs)
 
-        soup = bs4.BeautifulSoup(response.content, features="html.parser")
+        soup = bs4.BeautifulSoup(
+            response.content,
+            features="html.parser",
+            parse_only=bs4.SoupStrainer("form"),
+        )
 
         form_tag = soup.find("form")
         if not form_tag:
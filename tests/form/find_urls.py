@@ -1,4 +1,5 @@
-from typing import List, Sequence, Dict, Optional
+from functools import lru_cache
+from typing import List, Sequence, Dict, Optional, Tuple
 
 from bs4 import BeautifulSoup
 from bs4.element import Tag, SoupStrainer
@@ -6,6 +7,17 @@ from bs4.element import Tag, SoupStrainer
 from conftest import KeyVal
 
 
+@lru_cache(maxsize=64)
+def find_page_links(page_content: str) -> Tuple[Tag, ...]:
+    """Parse the links of a page once; testers look the same page up
+    several times. Callers must not modify the returned tags."""
+    return tuple(
+        BeautifulSoup(
+            page_content, features="html.parser", parse_only=SoupStrainer("a")
+        )
+    )
+
+
 def find_links_between_lines(
     page_content: str,
     urls_start_with: str,
@@ -22,11 +34,8 @@ def find_links_between_lines(
             ]
         )
     result_links = []
-    link_soup = BeautifulSoup(
-        page_content, features="html.parser", parse_only=SoupStrainer("a")
-    )
     link: Tag
-    for link in link_soup:
+    for link in find_page_links(page_content):
         if (
             link.get("href")
             and (
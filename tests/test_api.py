@@ -0,0 +1,83 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def api_posts(mixer: Mixer, published_category, user):
+    now = timezone.now()
+    return mixer.cycle(25).blend(
+        "blog.Post", author=user, category=published_category,
+        is_published=True, location=None, image="",
+        pub_date=(now - timedelta(hours=hour) for hour in range(1, 26)),
+    )
+
+
+def test_api_feeds_paginate_with_cursor(
+        client, api_posts, future_posts, posts_with_unpublished_category
+):
+    post = api_posts[0]
+    urls = (
+        "/api/v1/posts/",
+        f"/api/v1/categories/{post.category.slug}/posts/",
+        f"/api/v1/profiles/{post.author.username}/posts/",
+    )
+    for url in urls:
+        ids = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            data = response.json()
+            ids.extend(item["id"] for item in data["results"])
+            url = data["next"]
+        assert ids == [post.id for post in api_posts], (
+            "Убедитесь, что API отдаёт только опубликованные публикации"
+            " постранично, от новых к старым."
+        )
+    assert client.get("/api/v1/posts/").json()["results"][0] == {
+        "id": post.id,
+        "title": post.title,
+        "text": post.text,
+        "pub_date": post.pub_date.isoformat(),
+        "author": post.author.username,
+        "category": {
+            "slug": post.category.slug, "title": post.category.title,
+        },
+        "location": None,
+        "image": None,
+        "comment_count": 0,
+    }
+
+
+def test_api_post_and_comments(
+        mixer: Mixer, client, api_posts, future_posts,
+        django_assert_num_queries
+):
+    post = api_posts[0]
+    comments = mixer.cycle(25).blend("blog.Comment", post=post)
+    response = client.get(f"/api/v1/posts/{post.id}/")
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["comment_count"] == 25
+    with django_assert_num_queries(2):
+        data = client.get(f"/api/v1/posts/{post.id}/comments/").json()
+    assert [comment["id"] for comment in data["results"]] == [
+        comment.id for comment in comments[:20]
+    ], "Убедитесь, что API отдаёт комментарии от старых к новым."
+    data = client.get(data["next"]).json()
+    assert len(data["results"]) == 5 and data["next"] is None
+
+    assert client.get(
+        f"/api/v1/posts/{future_posts[0].id}/"
+    ).status_code == HTTPStatus.NOT_FOUND, (
+        "Убедитесь, что API не отдаёт неопубликованные публикации."
+    )
+    response = client.get("/api/v1/posts/?cursor=broken")
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert client.get(
+        "/api/v1/profiles/nobody/posts/"
+    ).status_code == HTTPStatus.NOT_FOUND
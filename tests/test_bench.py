@@ -0,0 +1,59 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_seed_and_bench(tmp_path, PostModel, CommentModel):
+    call_command(
+        "seed_blog", "--users=5", "--categories=3", "--locations=2",
+        "--posts=40", "--comments=80", "--scheduled=0",
+        stdout=StringIO(), stderr=StringIO(),
+    )
+    assert PostModel.objects.count() == 40
+    assert CommentModel.objects.count() == 80
+    post = PostModel.objects.order_by("-comment_count").first()
+    assert post.comment_count == post.comments.count(), (
+        "Убедитесь, что seed_blog пересчитывает число комментариев."
+    )
+
+    output = tmp_path / "bench.json"
+    call_command(
+        "bench_blog", "--requests=2", "--warmup=0", f"--output={output}",
+        stderr=StringIO(),
+    )
+    result = json.loads(output.read_text(encoding="utf-8"))
+    assert result["posts"] == 40
+    assert set(result["views"]) == {
+        "index", "category_posts", "profile", "post_detail",
+        "add_comment", "edit_post",
+    }
+    writes = {"add_comment", "edit_post"}
+    for name, view in result["views"].items():
+        assert view["status"] == (302 if name in writes else 200), (
+            f"Убедитесь, что бенчмарк `{name}` получает успешный ответ."
+        )
+        assert view["queries"] > 0 and view["latency_ms"]["p50"] > 0
+    assert CommentModel.objects.count() == 80, (
+        "Убедитесь, что бенчмарк отменяет запросы на запись."
+    )
+    post.refresh_from_db()
+    assert post.comment_count == post.comments.count()
+    call_command(
+        "bench_blog", "--requests=2", "--warmup=0",
+        f"--baseline={output}", "--tolerance=1000",
+        stdout=StringIO(), stderr=StringIO(),
+    )
+
+
+def test_explain_feeds_on_small_database(mixer, published_category):
+    mixer.cycle(3).blend("blog.Post", category=published_category)
+    out = StringIO()
+    call_command("explain_feeds", "--repeat=1", stdout=out)
+    assert "index_keyset_page" in out.getvalue(), (
+        "Убедитесь, что explain_feeds работает, когда публикаций меньше,"
+        " чем нужно для --deep-page."
+    )
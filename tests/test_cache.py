@@ -0,0 +1,99 @@
+import pytest
+from django.db.models import Model
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_post_card_follows_related_changes(
+        visible_post: Model, client, mixer: Mixer, CommentModel: Model
+):
+    assert visible_post.title in client.get("/").content.decode()
+    type(visible_post).objects.filter(pk=visible_post.pk).update(
+        title="Обход кэша"
+    )
+    assert visible_post.title in client.get("/").content.decode(), (
+        "Убедитесь, что карточка публикации берётся из кэша, пока"
+        " публикация не изменилась."
+    )
+
+    category = visible_post.category
+    category.title = "Обновлённая категория"
+    category.save()
+    assert category.title in client.get("/").content.decode(), (
+        "Убедитесь, что кэш карточки публикации сбрасывается при"
+        " изменении категории."
+    )
+
+    location = visible_post.location
+    location.name = "Обновлённое место"
+    location.save()
+    assert location.name in client.get("/").content.decode(), (
+        "Убедитесь, что кэш карточки публикации сбрасывается при"
+        " изменении местоположения."
+    )
+
+    mixer.blend(CommentModel, post=visible_post)
+    assert "Комментарии (1)" in client.get("/").content.decode(), (
+        "Убедитесь, что кэш карточки публикации сбрасывается при"
+        " добавлении комментария."
+    )
+
+
+def test_anonymous_feed_pages_are_cached(
+        visible_post: Model, client, user_client, mixer: Mixer,
+        CommentModel: Model, another_category
+):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    Post = type(visible_post)
+    urls = (
+        "/",
+        f"/category/{visible_post.category.slug}/",
+        f"/profile/{visible_post.author.username}/",
+    )
+    for url in urls:
+        client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            assert visible_post.title in client.get(url).content.decode()
+        assert not queries, (
+            f"Убедитесь, что страница `{url}` для анонимного пользователя"
+            " отдаётся из кэша без запросов к базе данных."
+        )
+
+    user_page = user_client.get(urls[0]).content.decode()
+    assert "Написать пост" in user_page, (
+        "Убедитесь, что авторизованные пользователи не получают страницу"
+        " из кэша анонимных пользователей."
+    )
+
+    mixer.blend(CommentModel, post=visible_post)
+    for url in urls:
+        assert "Комментарии (1)" in client.get(url).content.decode(), (
+            f"Убедитесь, что кэш страницы `{url}` сбрасывается при"
+            " добавлении комментария к публикации на ней."
+        )
+
+    other_post = mixer.blend(
+        "blog.Post",
+        category=another_category,
+        is_published=True,
+        pub_date=visible_post.pub_date,
+    )
+    with CaptureQueriesContext(connection) as queries:
+        client.get(urls[1])
+        client.get(urls[2])
+    assert not queries, (
+        "Убедитесь, что публикация в другой категории другого автора не"
+        " сбрасывает кэш несвязанных страниц."
+    )
+    assert other_post.title in client.get(urls[0]).content.decode()
+
+    category = visible_post.category
+    category.is_published = False
+    category.save()
+    assert visible_post.title not in client.get(urls[0]).content.decode(), (
+        "Убедитесь, что кэш ленты сбрасывается при снятии категории с"
+        " публикации."
+    )
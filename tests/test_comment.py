@@ -11,7 +11,13 @@ from django.forms import BaseForm
 from django.utils import timezone
 
 from adapters.post import PostModelAdapter
-from conftest import _TestModelAttrs, KeyVal, get_a_post_get_response_safely
+from conftest import (
+    N_PER_PAGE,
+    SESSION_AND_USER_QUERIES,
+    _TestModelAttrs,
+    KeyVal,
+    get_a_post_get_response_safely,
+)
 from fixtures.types import CommentModelAdapterT
 from form.base_form_tester import (
     FormValidationException, AuthorisedSubmitTester)
@@ -298,3 +304,53 @@ def test_404_on_comment_deleted_post(
         ),
         assert_created=False,
     )
+
+
+@pytest.mark.django_db
+def test_post_page_comment_queries(
+        user_client: django.test.Client,
+        unlogged_client: django.test.Client,
+        mixer,
+        post_with_published_location: Any,
+        CommentModel: Type[Model],
+        CommentModelAdapter: CommentModelAdapterT,
+        query_budget,
+):
+    post = post_with_published_location
+    post_field_name = CommentModelAdapter(CommentModel).post.field.name
+
+    def add_comments():
+        # Comments by different authors, so a lookup per author shows up.
+        mixer.cycle(N_PER_PAGE).blend(
+            f"blog.{CommentModel.__name__}", **{post_field_name: post}
+        )
+
+    url = f"/posts/{post.id}/"
+    for client in (user_client, unlogged_client):
+        query_budget.assert_constant(client, url, add_comments)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("url_template", "view_queries"),
+    [
+        ("/posts/{post.id}/comment/", 4),
+        ("/posts/{post.id}/edit_comment/{comment.id}/", 3),
+        ("/posts/{post.id}/delete_comment/{comment.id}/", 4),
+    ],
+    ids=["add_comment", "edit_comment", "delete_comment"],
+)
+def test_comment_form_queries(
+        url_template, view_queries, user_client: django.test.Client,
+        user: Model, comment_to_a_post: Model, query_budget,
+):
+    comment_to_a_post.author = user
+    comment_to_a_post.save()
+    url = url_template.format(
+        post=comment_to_a_post.post, comment=comment_to_a_post
+    )
+    response = query_budget.assert_within(
+        user_client, url, SESSION_AND_USER_QUERIES + view_queries, "post",
+        {"text": "Новый текст"},
+    )
+    assert response.status_code == HTTPStatus.FOUND
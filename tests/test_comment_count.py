@@ -0,0 +1,69 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Model
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comment_count_follows_comments(
+        mixer: Mixer, post_with_published_location: Model,
+        CommentModel: Model
+):
+    post = post_with_published_location
+    comments = mixer.cycle(3).blend(CommentModel, post=post)
+    post.refresh_from_db()
+    assert post.comment_count == 3, (
+        "Убедитесь, что при создании комментария увеличивается"
+        " `comment_count` публикации."
+    )
+    comments[0].delete()
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        "Убедитесь, что при удалении комментария уменьшается"
+        " `comment_count` публикации."
+    )
+
+
+def test_rebuild_comment_count(
+        mixer: Mixer, post_with_published_location: Model,
+        CommentModel: Model, PostModel: Model
+):
+    post = post_with_published_location
+    mixer.cycle(4).blend(CommentModel, post=post)
+    PostModel.objects.update(comment_count=0)
+    call_command("rebuild_comment_count", stdout=StringIO())
+    post.refresh_from_db()
+    assert post.comment_count == 4, (
+        "Убедитесь, что команда `rebuild_comment_count` пересчитывает"
+        " количество комментариев."
+    )
+
+
+def test_cascade_deletes_skip_per_comment_updates(
+        mixer: Mixer, post_with_published_location: Model,
+        CommentModel: Model, PostModel: Model, django_assert_max_num_queries
+):
+    post = post_with_published_location
+    commenter = mixer.blend("auth.User")
+    mixer.cycle(2).blend(CommentModel, post=post, author=commenter)
+    kept = mixer.blend(CommentModel, post=post)
+    doomed = mixer.blend("blog.Post", category=post.category)
+    mixer.cycle(50).blend(CommentModel, post=doomed)
+
+    with django_assert_max_num_queries(20):
+        doomed.delete()
+    assert not PostModel.objects.filter(pk=doomed.pk).exists()
+
+    commenter.delete()
+    post.refresh_from_db()
+    assert post.comment_count == 1, (
+        "Убедитесь, что при удалении пользователя пересчитывается"
+        " `comment_count` публикаций, которые он комментировал."
+    )
+    assert list(post.comments.all()) == [kept]
+    kept.delete()
+    post.refresh_from_db()
+    assert post.comment_count == 0
@@ -0,0 +1,77 @@
+from http import HTTPStatus
+
+import pytest
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_post_detail_conditional_get(
+        mixer: Mixer, client, visible_post, django_assert_num_queries
+):
+    url = f"/posts/{visible_post.id}/"
+    etag = client.get(url)["ETag"]
+    with django_assert_num_queries(1):
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+        "Убедитесь, что страница публикации отвечает 304 без загрузки"
+        " комментариев, если ETag не изменился."
+    )
+
+    comment = mixer.blend("blog.Comment", post=visible_post)
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что ETag публикации меняется с новым комментарием."
+    )
+    etag = response["ETag"]
+    comment.text = "Исправленный комментарий"
+    comment.save()
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == (
+        HTTPStatus.OK
+    ), "Убедитесь, что ETag публикации меняется при правке комментария."
+
+
+def test_feed_pages_conditional_get(
+        client, user_client, visible_post, django_assert_num_queries
+):
+    urls = (
+        "/",
+        f"/category/{visible_post.category.slug}/",
+        f"/profile/{visible_post.author.username}/",
+    )
+    etags = {}
+    for url in urls:
+        response = client.get(url)
+        etag = etags[url] = response["ETag"]
+        assert response["Last-Modified"]
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f"Убедитесь, что страница `{url}` отвечает 304 без запросов к"
+            " базе данных, если ETag не изменился."
+        )
+        response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            "Убедитесь, что ETag страницы для анонимного пользователя не"
+            " подходит авторизованному."
+        )
+        assert not response.has_header("ETag"), (
+            "Убедитесь, что страницы авторизованных пользователей, несущие"
+            " их CSRF-токен, отдаются без ETag."
+        )
+
+    visible_post.title = "Новый заголовок"
+    visible_post.save()
+    for url, etag in etags.items():
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == (
+            HTTPStatus.OK
+        ), f"Убедитесь, что ETag страницы `{url}` меняется с публикацией."
+
+
+def test_error_pages_have_no_validators(client):
+    response = client.get("/category/no-such-category/")
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert not response.has_header("ETag"), (
+        "Убедитесь, что ETag и Last-Modified ставятся только на ответы 200."
+    )
+    assert not response.has_header("Last-Modified")
@@ -14,6 +14,7 @@ from adapters.model_adapter import ModelAdapter
 from adapters.post import PostModelAdapter
 from conftest import (
     N_PER_PAGE,
+    SESSION_AND_USER_QUERIES,
     UrlRepr,
     _testget_context_item_by_class,
     _testget_context_item_by_key,
@@ -576,3 +577,39 @@ class TestContent:
             assert (
                 img_n_with_post_img[i] - img_n_without_post_img
             ) == 1, tester.image_display_error
+
+
+@pytest.mark.parametrize(
+    ("url_template", "view_queries"),
+    [
+        ("/", 1),
+        ("/category/{post.category.slug}/", 1),
+        ("/profile/{post.author.username}/", 3),
+    ],
+    ids=["index", "category", "profile"],
+)
+@pytest.mark.parametrize("client_fixture", ["user_client", "unlogged_client"])
+def test_post_list_queries(
+    request, url_template, view_queries, client_fixture, mixer: Mixer,
+    post_with_published_location: Model, query_budget,
+):
+    post = post_with_published_location
+    url = url_template.format(post=post)
+    client = request.getfixturevalue(client_fixture)
+
+    def add_posts():
+        # Every post gets its own location, so a lookup per post shows up.
+        mixer.cycle(N_PER_PAGE).blend(
+            "blog.Post",
+            author=post.author,
+            category=post.category,
+            location__is_published=True,
+        )
+
+    query_budget.assert_constant(client, url, add_posts)
+    client.get(url)
+    budget = (
+        SESSION_AND_USER_QUERIES + view_queries
+        if client_fixture == "user_client" else 0
+    )
+    query_budget.assert_within(client, url, budget)
@@ -0,0 +1,68 @@
+import csv
+import json
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def staff_client(mixer: Mixer):
+    client = Client()
+    client.force_login(mixer.blend("auth.User", is_staff=True))
+    return client
+
+
+def _streamed(response):
+    return b"".join(response.streaming_content).decode()
+
+
+def test_export_is_staff_only(user_client, staff_client):
+    assert user_client.get("/export/posts/").status_code == (
+        HTTPStatus.FORBIDDEN
+    ), "Убедитесь, что выгрузка доступна только сотрудникам."
+    assert staff_client.get("/export/users/").status_code == (
+        HTTPStatus.NOT_FOUND
+    )
+    assert staff_client.get(
+        "/export/posts/", {"since": "вчера"}
+    ).status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_export_streams_filtered_posts(
+        staff_client, mixer: Mixer, published_category, another_category
+):
+    posts = mixer.cycle(3).blend("blog.Post", category=published_category)
+    mixer.blend("blog.Post", category=another_category)
+
+    response = staff_client.get(
+        "/export/posts/", {"category": published_category.slug}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.streaming, (
+        "Убедитесь, что выгрузка отдаётся потоком (StreamingHttpResponse)."
+    )
+    rows = [json.loads(line) for line in _streamed(response).splitlines()]
+    assert [row["id"] for row in rows] == [post.id for post in posts], (
+        "Убедитесь, что выгрузка учитывает фильтр по категории."
+    )
+    assert rows[0]["title"] == posts[0].title
+    assert rows[0]["category_slug"] == published_category.slug
+
+    response = staff_client.get("/export/categories/", {"format": "csv"})
+    table = list(csv.reader(StringIO(_streamed(response))))
+    assert table[0][:4] == ["id", "title", "description", "slug"]
+    assert len(table) == 3
+
+
+def test_export_command(comment):
+    out = StringIO()
+    call_command("export_blog", "comments", "--chunk-size", "1", stdout=out)
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [row["id"] for row in rows] == [comment.id]
+    assert rows[0]["text"] == comment.text
@@ -0,0 +1,83 @@
+from datetime import timedelta
+from http import HTTPStatus
+from xml.etree import ElementTree
+
+import pytest
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _titles(response):
+    root = ElementTree.fromstring(response.content)
+    return [
+        element.text for element in root.iter()
+        if element.tag.rsplit("}", 1)[-1] == "title"
+    ][1:]
+
+
+@pytest.fixture
+def feed_post(mixer: Mixer, published_category, user):
+    return mixer.blend(
+        "blog.Post", title="Свежая публикация", author=user,
+        category=published_category,
+        pub_date=timezone.now() - timedelta(days=1),
+    )
+
+
+@pytest.mark.parametrize("suffix", ["rss/", "atom/"])
+def test_feeds_list_visible_posts(
+        client, feed_post, future_posts, posts_with_unpublished_category,
+        suffix
+):
+    urls = (
+        f"/{suffix}",
+        f"/category/{feed_post.category.slug}/{suffix}",
+        f"/profile/{feed_post.author.username}/{suffix}",
+    )
+    for url in urls:
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert _titles(response) == [feed_post.title], (
+            f"Убедитесь, что лента `{url}` показывает только опубликованные"
+            " публикации из опубликованных категорий с датой в прошлом."
+        )
+
+
+def test_category_feed_of_hidden_category_is_not_found(
+        client, posts_with_unpublished_category
+):
+    slug = posts_with_unpublished_category[0].category.slug
+    assert client.get(f"/category/{slug}/rss/").status_code == (
+        HTTPStatus.NOT_FOUND
+    )
+
+
+def test_feed_conditional_get(
+        client, feed_post, django_assert_max_num_queries
+):
+    response = client.get("/rss/")
+    etag = response["ETag"]
+    last_modified = response["Last-Modified"]
+    assert etag and last_modified, (
+        "Убедитесь, что ленты отдают заголовки ETag и Last-Modified."
+    )
+    with django_assert_max_num_queries(1):
+        response = client.get("/rss/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+        "Убедитесь, что лента отвечает 304, если ETag не изменился."
+    )
+    response = client.get("/rss/", HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert client.get("/atom/", HTTP_IF_NONE_MATCH=etag).status_code == (
+        HTTPStatus.OK
+    ), "Убедитесь, что у RSS и Atom разные ETag."
+
+    feed_post.title = "Исправленный заголовок"
+    feed_post.save()
+    response = client.get("/rss/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что ETag ленты меняется при изменении публикации."
+    )
+    assert _titles(response) == [feed_post.title]
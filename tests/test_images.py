@@ -0,0 +1,64 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from django.core.files.images import ImageFile
+from django.core.files.storage import default_storage
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _image_file(size, name="large.png"):
+    buffer = BytesIO()
+    Image.new("RGB", size, color=(12, 90, 200)).save(buffer, format="PNG")
+    return ImageFile(buffer, name=name)
+
+
+def test_renditions_are_built_on_upload(
+        mixer: Mixer, user, published_category, client
+):
+    post = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        image=_image_file((2000, 1000)),
+    )
+    post.refresh_from_db()
+    assert post.renditions["source"] == post.image.name
+    feed, detail = post.renditions["feed"], post.renditions["detail"]
+    assert (feed["width"], feed["height"]) == (640, 320)
+    assert (detail["width"], detail["height"]) == (1280, 640), (
+        "Убедитесь, что при загрузке фото создаются уменьшенные копии"
+        " для ленты и страницы публикации."
+    )
+    for rendition in (feed, detail):
+        for extension in ("webp", "jpg"):
+            assert default_storage.exists(rendition[extension])
+
+    content = client.get("/").content.decode()
+    assert f'{post.image_renditions["feed"]["webp_url"]} 640w' in content, (
+        "Убедитесь, что в ленте используются уменьшенные копии фото."
+    )
+    assert 'width="640" height="320"' in content
+
+    post.image = None
+    post.save()
+    post.refresh_from_db()
+    assert post.renditions == {}
+
+
+def test_same_upload_reuses_renditions(
+        mixer: Mixer, user, published_category
+):
+    first, second = mixer.cycle(2).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        image=(_image_file((800, 600), f"same{i}.png") for i in range(2)),
+    )
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert first.renditions["feed"] == second.renditions["feed"], (
+        "Убедитесь, что имена копий зависят от содержимого фото."
+    )
@@ -0,0 +1,91 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Model
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _export(tmp_path, name, export_format="ndjson"):
+    path = tmp_path / f"{name}.{export_format}"
+    call_command(
+        "export_blog", name, "--format", export_format, "--output", str(path)
+    )
+    return str(path)
+
+
+def _import(name, path, *args):
+    out, err = StringIO(), StringIO()
+    call_command("import_blog", name, path, *args, stdout=out, stderr=err)
+    return out.getvalue()
+
+
+def test_import_restores_export(
+        tmp_path, mixer: Mixer, post_with_published_location: Model,
+        CommentModel: Model, PostModel: Model
+):
+    from blog.models import Category, Location
+
+    post = post_with_published_location
+    comments = mixer.cycle(3).blend(CommentModel, post=post)
+    paths = {
+        "categories": _export(tmp_path, "categories", "csv"),
+        "locations": _export(tmp_path, "locations"),
+        "posts": _export(tmp_path, "posts", "csv"),
+        "comments": _export(tmp_path, "comments"),
+    }
+    PostModel.objects.all().delete()
+    Category.objects.all().delete()
+    Location.objects.all().delete()
+
+    for name, path in paths.items():
+        _import(name, path)
+    imported = PostModel.objects.get()
+    assert (imported.id, imported.title, imported.text) == (
+        post.id, post.title, post.text
+    ), "Убедитесь, что `import_blog` загружает выгруженные публикации."
+    assert imported.pub_date == post.pub_date
+    assert imported.created_at == post.created_at, (
+        "Убедитесь, что при импорте сохраняются исходные даты создания."
+    )
+    assert imported.author_id == post.author_id
+    assert imported.category.slug == post.category.slug
+    assert imported.location.name == post.location.name
+    assert imported.comment_count == 3, (
+        "Убедитесь, что после импорта комментариев пересчитывается"
+        " `comment_count` публикаций."
+    )
+    assert list(
+        CommentModel.objects.values_list("id", "created_at")
+    ) == [(comment.id, comment.created_at) for comment in comments]
+
+    output = _import("comments", paths["comments"], "--resume")
+    assert "Импортировано: 0, пропущено: 3" in output, (
+        "Убедитесь, что с `--resume` уже загруженные строки пропускаются."
+    )
+    assert CommentModel.objects.count() == 3
+
+
+def test_import_keeps_locations_with_same_name(
+        tmp_path, mixer: Mixer, PostModel: Model
+):
+    from blog.models import Location
+
+    first, second = mixer.cycle(2).blend(Location, name="Москва")
+    posts = [
+        mixer.blend(PostModel, location=first),
+        mixer.blend(PostModel, location=second),
+    ]
+    path = _export(tmp_path, "posts", "csv")
+    PostModel.objects.all().delete()
+    second.delete()
+
+    _import("posts", path)
+    assert dict(PostModel.objects.values_list("id", "location_id")) == {
+        posts[0].id: first.id, posts[1].id: None,
+    }, (
+        "Убедитесь, что при импорте публикации связываются с "
+        "местоположением по id, а не по неуникальному названию."
+    )
@@ -0,0 +1,168 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.db.models import Model
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def many_past_posts(mixer: Mixer, user, published_category):
+    same_date = timezone.now() - timedelta(days=1)
+    pub_dates = (
+        same_date if i % 3 else same_date - timedelta(hours=i)
+        for i in range(N_PER_PAGE * 2)
+    )
+    return mixer.cycle(N_PER_PAGE * 2).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=pub_dates,
+    )
+
+
+def _walk_pages(paginator, cursor=None, direction="next_cursor"):
+    seen = []
+    while True:
+        page = paginator.page(cursor)
+        seen.append([post.id for post in page])
+        cursor = getattr(page, direction)
+        if cursor is None:
+            return seen
+
+
+def test_keyset_paginator_walks_all_posts(
+        many_past_posts, PostModel: Model
+):
+    from blog.paginators import KeysetPaginator
+
+    queryset = PostModel.objects.all()
+    expected = list(
+        queryset.order_by("-pub_date", "-id").values_list("id", flat=True)
+    )
+    paginator = KeysetPaginator(queryset, N_PER_PAGE - 3)
+    pages = _walk_pages(paginator)
+    assert [post_id for page in pages for post_id in page] == expected, (
+        "Убедитесь, что курсорная пагинация проходит все публикации по"
+        " порядку, без пропусков и повторов."
+    )
+
+    last_page = paginator.page(None)
+    while last_page.has_next():
+        last_page = paginator.page(last_page.next_cursor)
+    back = _walk_pages(
+        paginator, last_page.previous_cursor, "previous_cursor"
+    )
+    assert list(reversed(back)) == pages[:-1], (
+        "Убедитесь, что курсор предыдущей страницы возвращает те же"
+        " страницы в обратном порядке."
+    )
+
+
+def test_keyset_paginator_rejects_broken_cursor(PostModel: Model):
+    from blog.paginators import InvalidCursor, KeysetPaginator
+
+    paginator = KeysetPaginator(PostModel.objects.all(), N_PER_PAGE)
+    for cursor in ("not-a-cursor", "WzAsWzFdXQ", "WzAsWyJ4IiwxXV0"):
+        with pytest.raises(InvalidCursor):
+            paginator.page(cursor)
+
+
+def test_index_keyset_mode(
+        monkeypatch, many_past_posts, client
+):
+    from blog.views import PostListView
+
+    monkeypatch.setattr(PostListView, "keyset_pagination", True)
+    response = client.get("/")
+    assert response.status_code == HTTPStatus.OK
+    page = response.context["page_obj"]
+    assert page.has_next() and not page.has_previous()
+    assert f"?cursor={page.next_cursor}" in response.content.decode()
+
+    response = client.get("/", {"cursor": page.next_cursor})
+    assert response.status_code == HTTPStatus.OK
+    assert response.context["page_obj"].has_previous()
+
+    response = client.get("/", {"cursor": "broken"})
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_feed_count_is_cached(many_past_posts, user_client, mixer: Mixer):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    def count_queries():
+        with CaptureQueriesContext(connection) as queries:
+            response = user_client.get("/")
+        assert response.status_code == HTTPStatus.OK
+        return sum("COUNT(" in query["sql"] for query in queries), response
+
+    assert count_queries()[0] == 1
+    count_queries_made, response = count_queries()
+    assert count_queries_made == 0, (
+        "Убедитесь, что количество публикаций в ленте берётся из кэша."
+    )
+    assert response.context["paginator"].count == N_PER_PAGE * 2
+
+    mixer.blend(
+        "blog.Post",
+        category=many_past_posts[0].category,
+        is_published=True,
+        pub_date=many_past_posts[0].pub_date,
+    )
+    count_queries_made, response = count_queries()
+    assert count_queries_made == 1, (
+        "Убедитесь, что кэш количества публикаций сбрасывается при"
+        " сохранении публикации."
+    )
+    assert response.context["paginator"].count == N_PER_PAGE * 2 + 1
+
+
+def test_post_comments_are_paginated(
+        mixer: Mixer, client, post_with_published_location: Model,
+        CommentModel: Model
+):
+    from blog.config import COMMENTS_PER_PAGE
+
+    post = post_with_published_location
+    comments = mixer.cycle(COMMENTS_PER_PAGE + 5).blend(
+        CommentModel, post=post
+    )
+    response = client.get(f"/posts/{post.id}/")
+    page = response.context["comments"]
+    assert [c.id for c in page] == [c.id for c in comments][
+        :COMMENTS_PER_PAGE
+    ], (
+        "Убедитесь, что на странице публикации выводится только первая"
+        " страница комментариев."
+    )
+    more_url = f"/posts/{post.id}/comments/?cursor={page.next_cursor}"
+    assert more_url in response.content.decode()
+
+    response = client.get(more_url)
+    assert response.status_code == HTTPStatus.OK
+    assert [c.id for c in response.context["comments"]] == [
+        c.id for c in comments
+    ][COMMENTS_PER_PAGE:], (
+        "Убедитесь, что по ссылке «Показать ещё» загружаются следующие"
+        " комментарии."
+    )
+    assert "data-comments-more" not in response.content.decode()
+
+    response = client.get(f"/posts/{post.id}/comments/?cursor=broken")
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+    post.is_published = False
+    post.save()
+    response = client.get(f"/posts/{post.id}/comments/")
+    assert response.status_code == HTTPStatus.NOT_FOUND, (
+        "Убедитесь, что комментарии к снятой с публикации записи недоступны"
+        " другим пользователям."
+    )
@@ -16,6 +16,7 @@ from django.utils import timezone
 from adapters.post import PostModelAdapter
 from blog.models import Post
 from conftest import (
+    SESSION_AND_USER_QUERIES,
     _TestModelAttrs,
     KeyVal,
     get_create_a_post_get_response_safely, get_get_response_safely,
@@ -368,3 +369,35 @@ def _test_edit_post(
         **update_props,
     )
     return edit_response, edit_url, del_url
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("url_template", "view_queries"),
+    [
+        # Choice lookups, their validation, the insert and the feeds.
+        ("/posts/create/", 6),
+        # The same plus the post itself and its feeds before the update.
+        ("/posts/{post.id}/edit/", 8),
+    ],
+    ids=["create_post", "edit_post"],
+)
+def test_post_form_queries(
+        url_template, view_queries, user_client: django.test.Client,
+        post_with_published_location: Model, query_budget,
+):
+    post = post_with_published_location
+    data = {
+        "title": "Заголовок",
+        "text": "Текст",
+        "pub_date": timezone.now().strftime("%Y-%m-%d"),
+        "category": post.category_id,
+        "location": post.location_id,
+        "is_published": True,
+    }
+    url = url_template.format(post=post)
+    response = query_budget.assert_within(
+        user_client, url, SESSION_AND_USER_QUERIES + view_queries, "post",
+        data,
+    )
+    assert response.status_code == HTTPStatus.FOUND
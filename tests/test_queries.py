@@ -0,0 +1,56 @@
+import pytest
+from django.core.cache import cache
+from django.db.models import Model
+
+from conftest import SESSION_AND_USER_QUERIES
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def own_comment(comment_to_a_post, user):
+    comment_to_a_post.author = user
+    comment_to_a_post.save()
+    return comment_to_a_post
+
+
+@pytest.mark.parametrize(
+    ("url_template", "view_queries"),
+    [
+        ("/posts/{post.id}/", 2),
+        ("/posts/{post.id}/edit/", 3),
+        ("/posts/{post.id}/delete/", 2),
+        ("/edit_profile/{user.username}/", 1),
+        ("/posts/{post.id}/edit_comment/{comment.id}/", 1),
+        ("/posts/{post.id}/delete_comment/{comment.id}/", 1),
+    ],
+    ids=[
+        "post_detail", "edit_post", "delete_post",
+        "edit_profile", "edit_comment", "delete_comment",
+    ],
+)
+def test_object_is_fetched_once(
+        url_template, view_queries, user_client, user,
+        post_with_published_location: Model, own_comment: Model,
+        django_assert_num_queries
+):
+    url = url_template.format(
+        post=post_with_published_location, user=user, comment=own_comment
+    )
+    with django_assert_num_queries(SESSION_AND_USER_QUERIES + view_queries):
+        user_client.get(url)
+
+
+def test_category_page_queries(
+        user_client, post_with_published_location: Model,
+        django_assert_num_queries
+):
+    from blog.cache import get_publication_boundary
+
+    url = f"/category/{post_with_published_location.category.slug}/"
+    user_client.get(url)
+    cache.clear()
+    # Shared by all feeds, so not a cost of the category page.
+    get_publication_boundary()
+    with django_assert_num_queries(SESSION_AND_USER_QUERIES + 2):
+        user_client.get(url)
@@ -0,0 +1,150 @@
+import shutil
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connections
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+REPLICA_ALIASES = ("replica_test_1", "replica_test_2")
+
+TEMPLATE_ALIAS = "replica_template"
+
+
+def _create_visible_post(alias, title):
+    from blog.models import Category, Post
+
+    author = get_user_model().objects.db_manager(alias).create(
+        username=f"author-{alias}"
+    )
+    category = Category.objects.using(alias).create(
+        title="Категория", description="", slug=f"category-{alias}"
+    )
+    return Post.objects.using(alias).create(
+        title=title,
+        text="Текст",
+        pub_date=timezone.now() - timedelta(days=1),
+        author=author,
+        category=category,
+    )
+
+
+def _close_alias(alias):
+    if hasattr(connections._connections, alias):
+        connections[alias].close()
+        delattr(connections._connections, alias)
+    connections.databases.pop(alias, None)
+
+
+@pytest.fixture(scope="session")
+def replica_template(tmp_path_factory, django_db_setup, django_db_blocker):
+    # Migrating a database takes longer than the tests themselves, so it
+    # is done once per worker and copied for every replica.
+    path = tmp_path_factory.mktemp("replicas") / "template.sqlite3"
+    connections.databases[TEMPLATE_ALIAS] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": str(path),
+    }
+    try:
+        with django_db_blocker.unblock():
+            call_command("migrate", database=TEMPLATE_ALIAS, verbosity=0)
+            _create_visible_post(TEMPLATE_ALIAS, "Пост из реплики")
+    finally:
+        _close_alias(TEMPLATE_ALIAS)
+    return path
+
+
+@pytest.fixture
+def sqlite_replicas(request, tmp_path, settings, replica_template):
+    def remove_replicas():
+        for alias in REPLICA_ALIASES:
+            _close_alias(alias)
+
+    request.addfinalizer(remove_replicas)
+    settings.DATABASE_REPLICAS = list(REPLICA_ALIASES)
+    for alias in REPLICA_ALIASES:
+        path = tmp_path / f"{alias}.sqlite3"
+        shutil.copyfile(replica_template, path)
+        connections.databases[alias] = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": str(path),
+        }
+    return REPLICA_ALIASES
+
+
+def test_feed_and_detail_read_from_replicas(sqlite_replicas, client):
+    primary_post = _create_visible_post("default", "Пост из основной базы")
+
+    content = client.get("/").content.decode()
+    assert "Пост из реплики" in content, (
+        "Убедитесь, что лента публикаций читается из реплики."
+    )
+    assert primary_post.title not in content
+
+    response = client.get(f"/posts/{primary_post.id}/")
+    assert "Пост из реплики" in response.content.decode(), (
+        "Убедитесь, что страница публикации читается из реплики."
+    )
+
+
+def test_request_reads_from_one_replica(sqlite_replicas, client):
+    from django.test.utils import CaptureQueriesContext
+
+    url = "/"
+    for _ in range(10):
+        cache.clear()
+        with CaptureQueriesContext(connections[sqlite_replicas[0]]) as first:
+            with CaptureQueriesContext(
+                    connections[sqlite_replicas[1]]) as second:
+                client.get(url)
+        assert bool(len(first)) != bool(len(second)), (
+            "Убедитесь, что все запросы одной страницы читаются из одной"
+            " реплики."
+        )
+
+
+def test_writes_pin_reads_to_primary(
+        sqlite_replicas, user, user_client, published_category
+):
+    from blog.models import Post
+
+    primary_post = _create_visible_post("default", "Пост из основной базы")
+    assert Post.objects.filter(pk=primary_post.pk).db == "default", (
+        "Убедитесь, что вне представлений чтение идёт из основной базы."
+    )
+
+    response = user_client.post(
+        "/posts/create/",
+        {
+            "title": "Новый пост",
+            "text": "Текст",
+            "pub_date": (timezone.now() - timedelta(days=1)).strftime(
+                "%Y-%m-%d"
+            ),
+            "category": published_category.id,
+            "is_published": True,
+        },
+        follow=True,
+    )
+    content = response.content.decode()
+    assert "Новый пост" in content, (
+        "Убедитесь, что после создания публикации страница, на которую"
+        " ведёт перенаправление, читается из основной базы, чтобы"
+        " пользователь видел результат своего действия."
+    )
+
+    response = user_client.post(
+        f"/posts/{primary_post.id}/comment/",
+        {"text": "Новый комментарий"},
+        follow=True,
+    )
+    content = response.content.decode()
+    assert "Новый комментарий" in content, (
+        "Убедитесь, что после добавления комментария страница публикации"
+        " читается из основной базы."
+    )
+    assert "Пост из реплики" not in content
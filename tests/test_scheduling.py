@@ -0,0 +1,120 @@
+from datetime import timedelta
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_scheduled_post_goes_live_on_time(
+        mixer: Mixer, client, published_category, user, monkeypatch
+):
+    now = timezone.now()
+    scheduled = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        is_published=True, pub_date=now + timedelta(hours=1),
+    )
+    urls = (
+        "/", f"/category/{published_category.slug}/",
+        "/api/v1/posts/", "/rss/",
+    )
+    etags = {}
+    for url in urls:
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert scheduled.title not in response.content.decode(), (
+            f"Убедитесь, что `{url}` не показывает отложенную публикацию."
+        )
+        etags[url] = response["ETag"]
+
+    monkeypatch.setattr(
+        timezone, "now", lambda: now + timedelta(hours=2)
+    )
+    for url, etag in etags.items():
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            f"Убедитесь, что кэш `{url}` сбрасывается, когда наступает"
+            " время отложенной публикации."
+        )
+        assert scheduled.title in response.content.decode(), (
+            f"Убедитесь, что `{url}` показывает публикацию, время которой"
+            " наступило."
+        )
+
+
+def test_publish_scheduled_reports_next_boundary(
+        mixer: Mixer, client, published_category, user,
+        django_capture_on_commit_callbacks
+):
+    out = StringIO()
+    call_command("publish_scheduled", "--once", stdout=out)
+    assert "Отложенных публикаций нет" in out.getvalue()
+
+    pub_date = timezone.now() + timedelta(days=1)
+    with django_capture_on_commit_callbacks(execute=True):
+        scheduled = mixer.blend(
+            "blog.Post", author=user, category=published_category,
+            is_published=True, pub_date=pub_date,
+        )
+    assert scheduled.title not in client.get("/").content.decode(), (
+        "Убедитесь, что новая отложенная публикация не попадает в ленту."
+    )
+    out = StringIO()
+    call_command("publish_scheduled", "--once", stdout=out)
+    assert pub_date.isoformat() in out.getvalue(), (
+        "Убедитесь, что граница видимости сдвигается к новой отложенной"
+        " публикации."
+    )
+
+
+def test_imported_scheduled_post_stays_hidden(
+        tmp_path, mixer: Mixer, client, published_category, user,
+        PostModel
+):
+    pub_date = timezone.now() + timedelta(hours=1)
+    scheduled = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        is_published=True, pub_date=pub_date,
+    )
+    path = str(tmp_path / "posts.ndjson")
+    call_command("export_blog", "posts", "--output", path)
+    PostModel.objects.all().delete()
+    assert client.get("/").status_code == HTTPStatus.OK
+
+    call_command("import_blog", "posts", path, stdout=StringIO(),
+                 stderr=StringIO())
+    assert scheduled.title not in client.get("/").content.decode(), (
+        "Убедитесь, что импортированная отложенная публикация не попадает"
+        " в ленту раньше времени."
+    )
+    out = StringIO()
+    call_command("publish_scheduled", "--once", stdout=out)
+    assert pub_date.isoformat() in out.getvalue(), (
+        "Убедитесь, что после импорта граница видимости сдвигается к"
+        " импортированной отложенной публикации."
+    )
+
+
+def test_bulk_update_cannot_show_scheduled_post(
+        mixer: Mixer, published_category, PostModel
+):
+    from blog.cache import reset_publication_boundary
+    from blog.views import get_res_qs
+
+    post = mixer.blend(
+        "blog.Post", category=published_category, is_published=True,
+        pub_date=timezone.now() - timedelta(hours=1),
+    )
+    assert get_res_qs(PostModel.objects).filter(pk=post.pk).exists()
+    PostModel.objects.filter(pk=post.pk).update(
+        pub_date=timezone.now() + timedelta(hours=1),
+    )
+    reset_publication_boundary()
+    assert not get_res_qs(PostModel.objects).filter(pk=post.pk).exists(), (
+        "Убедитесь, что после update() и reset_publication_boundary()"
+        " перенесённая в будущее публикация скрывается из лент."
+    )
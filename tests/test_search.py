@@ -0,0 +1,84 @@
+from http import HTTPStatus
+
+import pytest
+from django.db.models import Model
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _search(client, query):
+    response = client.get("/search/", {"q": query})
+    assert response.status_code == HTTPStatus.OK
+    return [post.id for post in response.context["page_obj"]]
+
+
+def test_search_ranks_title_matches_first(
+        mixer: Mixer, client, published_category
+):
+    in_text = mixer.blend(
+        "blog.Post", title="Заметки", text="Про горные велосипеды",
+        category=published_category,
+    )
+    in_title = mixer.blend(
+        "blog.Post", title="Велосипеды", text="Обзор моделей",
+        category=published_category,
+    )
+    mixer.blend(
+        "blog.Post", title="Рыбалка", text="Озёра и реки",
+        category=published_category,
+    )
+    assert _search(client, "велосипеды") == [in_title.id, in_text.id], (
+        "Убедитесь, что поиск находит публикации по заголовку и тексту и"
+        " ставит совпадения в заголовке выше."
+    )
+
+    in_title.title = "Самокаты"
+    in_title.save()
+    assert _search(client, "велосипеды") == [in_text.id], (
+        "Убедитесь, что поисковый индекс обновляется при изменении"
+        " публикации."
+    )
+    assert _search(client, '"OR (NEAR') == []
+    assert _search(client, "") == []
+
+
+def test_search_respects_visibility(
+        mixer: Mixer, client, published_category, future_posts,
+        posts_with_unpublished_category, PostModel: Model
+):
+    hidden = [*future_posts, *posts_with_unpublished_category]
+    hidden.append(mixer.blend(
+        "blog.Post", is_published=False, category=published_category,
+    ))
+    PostModel.objects.filter(
+        pk__in=[post.pk for post in hidden]
+    ).update(title="Секрет")
+    visible = mixer.blend(
+        "blog.Post", title="Секрет", category=published_category
+    )
+    assert _search(client, "секрет") == [visible.id], (
+        "Убедитесь, что поиск показывает только публикации, доступные в"
+        " ленте."
+    )
+
+
+def test_hidden_posts_do_not_use_up_candidates(
+        mixer: Mixer, client, published_category, monkeypatch
+):
+    import blog.search
+
+    monkeypatch.setattr(blog.search, "SEARCH_MAX_CANDIDATES", 2)
+    monkeypatch.setattr(blog.search, "SEARCH_CHUNK_SIZE", 2)
+    visible = [
+        mixer.blend("blog.Post", title="Маяк", category=published_category)
+        for _ in range(3)
+    ]
+    mixer.cycle(3).blend(
+        "blog.Post", title="Маяк", is_published=False,
+        category=published_category,
+    )
+    assert sorted(_search(client, "маяк")) == [visible[1].id, visible[2].id], (
+        "Убедитесь, что скрытые публикации не занимают место среди"
+        " ранжируемых кандидатов поиска."
+    )
@@ -0,0 +1,158 @@
+from http import HTTPStatus
+
+import pytest
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def built_suggestions():
+    # Lookups only start builds in a thread, which would not see the data
+    # of the test transaction; build once here and let signals follow.
+    from blog.suggest import suggestions
+
+    suggestions.build()
+
+
+def _suggest(client, query):
+    response = client.get("/suggest/", {"q": query})
+    assert response.status_code == HTTPStatus.OK
+    return response.json()
+
+
+def test_suggest_matches_prefixes(
+        mixer: Mixer, client, published_category, user
+):
+    post = mixer.blend(
+        "blog.Post", title="Горные велосипеды", category=published_category,
+    )
+    mixer.blend("blog.Post", title="Рыбалка", category=published_category)
+    published_category.title = "Горы"
+    published_category.save()
+    user.username = "gorynych"
+    user.save()
+    found = _suggest(client, "  ГОР")
+    assert found["posts"] == [
+        {"title": post.title, "url": f"/posts/{post.id}/"}
+    ], "Убедитесь, что подсказки находят публикации по началу заголовка."
+    assert found["categories"] == [{
+        "title": "Горы",
+        "url": f"/category/{published_category.slug}/",
+    }], "Убедитесь, что подсказки находят категории по началу названия."
+    assert _suggest(client, "GORY")["users"] == [
+        {"username": "gorynych", "url": "/profile/gorynych/"}
+    ], "Убедитесь, что подсказки находят пользователей по началу имени."
+    assert _suggest(client, "") == {
+        "posts": [], "categories": [], "users": [],
+    }
+
+
+def test_suggest_follows_changes_without_queries(
+        mixer: Mixer, client, published_category,
+        django_assert_num_queries
+):
+    post = mixer.blend(
+        "blog.Post", title="Велосипеды", category=published_category,
+    )
+    assert len(_suggest(client, "вел")["posts"]) == 1
+    with django_assert_num_queries(0):
+        _suggest(client, "вело")
+
+    post.title = "Самокаты"
+    post.save()
+    assert _suggest(client, "вел")["posts"] == [], (
+        "Убедитесь, что подсказки обновляются при изменении публикации."
+    )
+    assert len(_suggest(client, "сам")["posts"]) == 1
+    post.delete()
+    assert _suggest(client, "сам")["posts"] == [], (
+        "Убедитесь, что подсказки обновляются при удалении публикации."
+    )
+
+
+def test_suggest_respects_visibility(
+        mixer: Mixer, client, published_category, future_posts,
+        posts_with_unpublished_category
+):
+    hidden = [*future_posts, *posts_with_unpublished_category]
+    hidden.append(mixer.blend(
+        "blog.Post", is_published=False, category=published_category,
+    ))
+    titles = set()
+    for post in hidden:
+        titles.update(
+            found["title"]
+            for found in _suggest(client, post.title[:3])["posts"]
+        )
+    assert not titles & {post.title for post in hidden}, (
+        "Убедитесь, что подсказки не показывают снятые с публикации,"
+        " отложенные и публикации из скрытых категорий."
+    )
+
+    visible = mixer.blend(
+        "blog.Post", title="Маяки", category=published_category,
+    )
+    published_category.is_published = False
+    published_category.save()
+    assert _suggest(client, published_category.title[:3])[
+        "categories"
+    ] == [], "Убедитесь, что подсказки не показывают скрытые категории."
+    assert _suggest(client, "мая")["posts"] == [], (
+        "Убедитесь, что подсказки не показывают публикации категории"
+        " после её снятия с публикации."
+    )
+    published_category.is_published = True
+    published_category.save()
+    assert _suggest(client, "мая")["posts"] == [
+        {"title": "Маяки", "url": f"/posts/{visible.id}/"}
+    ], (
+        "Убедитесь, что публикации категории снова появляются в подсказках"
+        " после её публикации."
+    )
+
+
+def test_suggest_never_builds_during_request(
+        client, monkeypatch, django_assert_num_queries
+):
+    from blog.suggest import suggestions
+
+    started = []
+    monkeypatch.setattr(
+        suggestions, "rebuild_in_background", lambda: started.append(True)
+    )
+    suggestions.clear()
+    with django_assert_num_queries(0):
+        assert _suggest(client, "вел")["posts"] == [], (
+            "Убедитесь, что до построения индекса подсказки пусты, а не"
+            " ждут его построения."
+        )
+    assert started, (
+        "Убедитесь, что устаревший индекс подсказок перестраивается в фоне."
+    )
+
+
+def test_suggest_keeps_changes_made_during_build(
+        mixer: Mixer, client, published_category, monkeypatch
+):
+    from blog.suggest import SuggestionIndexes, suggestions
+
+    load = SuggestionIndexes.load.__func__
+
+    def load_then_save_post(cls):
+        indexes = load(cls)
+        mixer.blend(
+            "blog.Post", title="Маяки", category=published_category,
+        )
+        return indexes
+
+    monkeypatch.setattr(
+        SuggestionIndexes, "load", classmethod(load_then_save_post)
+    )
+    suggestions.build()
+    assert [post["title"] for post in _suggest(client, "мая")["posts"]] == [
+        "Маяки"
+    ], (
+        "Убедитесь, что изменения, сделанные во время перестроения индекса"
+        " подсказок, не теряются после него."
+    )
@@ -0,0 +1,104 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def database_tasks(settings):
+    settings.BLOG_TASK_BACKEND = "blog.tasks.DatabaseBackend"
+
+
+def test_image_is_rendered_by_worker(
+        database_tasks, post_with_published_location
+):
+    from blog.models import ImageStatus, QueuedTask, TaskStatus
+
+    post = post_with_published_location
+    post.refresh_from_db()
+    assert post.image_status == ImageStatus.PENDING
+    assert post.renditions == {}, (
+        "Убедитесь, что фото обрабатывается не во время запроса, а в"
+        " фоновой задаче."
+    )
+    queued = QueuedTask.objects.get()
+
+    call_command("run_tasks", "--once", stdout=StringIO())
+    post.refresh_from_db()
+    queued.refresh_from_db()
+    assert queued.status == TaskStatus.DONE
+    assert post.image_status == ImageStatus.READY, (
+        "Убедитесь, что после обработки фото у публикации меняется статус."
+    )
+    assert post.renditions["source"] == post.image.name
+
+
+@pytest.fixture
+def always_fails():
+    from blog.tasks import _registry, task
+
+    failures = []
+
+    def remember_failure(args, error):
+        failures.append(args)
+
+    @task(max_retries=2, retry_delay=0, on_failure=remember_failure)
+    def always_fails(value):
+        raise RuntimeError(value)
+
+    always_fails.failures = failures
+    yield always_fails
+    _registry.pop(always_fails.name, None)
+
+
+def test_failed_task_is_retried(database_tasks, always_fails):
+    from blog.models import QueuedTask, TaskStatus
+
+    always_fails.delay("boom")
+    call_command("run_tasks", "--once", stdout=StringIO())
+    queued = QueuedTask.objects.get()
+    assert queued.attempts == 3, (
+        "Убедитесь, что упавшая задача перезапускается `max_retries` раз."
+    )
+    assert queued.status == TaskStatus.FAILED
+    assert "RuntimeError: boom" in queued.last_error
+    assert always_fails.failures == [["boom"]]
+
+
+def test_task_of_crashed_worker_is_reclaimed(
+        database_tasks, post_with_published_location, always_fails
+):
+    from blog.models import QueuedTask, TaskStatus
+
+    now = timezone.now()
+    lost = QueuedTask.objects.get()
+    lost.status = TaskStatus.RUNNING
+    lost.attempts = 1
+    lost.run_after = now - timedelta(seconds=1)
+    lost.save()
+    leased = QueuedTask.objects.create(
+        name=always_fails.name, args=["занята"], status=TaskStatus.RUNNING,
+        attempts=1, run_after=now + timedelta(minutes=5),
+    )
+    exhausted = QueuedTask.objects.create(
+        name=always_fails.name, args=["потеряна"],
+        status=TaskStatus.RUNNING, attempts=3,
+        run_after=now - timedelta(seconds=1),
+    )
+
+    call_command("run_tasks", "--once", stdout=StringIO())
+    for queued in (lost, leased, exhausted):
+        queued.refresh_from_db()
+    assert lost.status == TaskStatus.DONE, (
+        "Убедитесь, что задача, аренда которой истекла, выполняется снова."
+    )
+    assert leased.status == TaskStatus.RUNNING and leased.attempts == 1, (
+        "Убедитесь, что задача с действующей арендой не выполняется"
+        " повторно."
+    )
+    assert exhausted.status == TaskStatus.FAILED
+    assert always_fails.failures == [["потеряна"]]
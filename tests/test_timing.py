@@ -0,0 +1,43 @@
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_timing_counts_queries():
+    from blog.models import Post
+    from blog.timing import Timing
+
+    with Timing() as timing:
+        list(Post.objects.all())
+        list(Post.objects.all())
+    assert timing.queries == 2
+    assert timing.total >= timing.db_time > 0
+
+
+def test_server_timing_and_staff_stats(
+        mixer, client, user_client, post_with_published_location
+):
+    from blog.timing import stats
+
+    stats.clear()
+    for _ in range(3):
+        response = client.get("/")
+    assert response["Server-Timing"].startswith("db;dur="), (
+        "Убедитесь, что ответы содержат заголовок Server-Timing."
+    )
+    assert "render;dur=" in response["Server-Timing"]
+
+    assert user_client.get("/timings/").status_code == HTTPStatus.FORBIDDEN, (
+        "Убедитесь, что статистика доступна только персоналу."
+    )
+    staff = mixer.blend("auth.User", is_staff=True)
+    staff_client = Client()
+    staff_client.force_login(staff)
+    summary = staff_client.get("/timings/").json()
+    assert summary["blog:index"]["count"] == 3, (
+        "Убедитесь, что статистика собирается по имени представления."
+    )
+    assert set(summary["blog:index"]["total_ms"]) == {"p50", "p95", "p99"}